@@ -0,0 +1,58 @@
+import io
+import os
+import sys
+import time
+import argparse
+import contextlib
+
+# add the src directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from algorithm.batch_teams import form_teams
+from algorithm.cover_steiner import cover_steiner
+from algorithm.graph_aware_cover_steiner import graph_aware_cover_steiner
+from evaluator.evaluation import load_data
+
+ALGORITHMS = {"CoverSteiner": cover_steiner, "GraphAwareCoverSteiner": graph_aware_cover_steiner}
+
+def run_benchmark(num_tasks, batch_size, seed):
+    G, author_skills, tasks = load_data()
+    tasks = tasks[:num_tasks]
+    seeds = [seed + i for i in range(len(tasks))]
+
+    print(f"\n Single calls against form_teams batches of {batch_size} over {len(tasks)} tasks")
+
+    for algorithm_name, algorithm in ALGORITHMS.items():
+        # single calls with their default bounded searches
+        start_time = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            single = [algorithm(G, author_skills, set(task["skills"]), seed=task_seed)
+                      for task, task_seed in zip(tasks, seeds)]
+        single_time = time.perf_counter() - start_time
+
+        # batches, each with its own tree cache
+        start_time = time.perf_counter()
+        batched = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for begin in range(0, len(tasks), batch_size):
+                batched += form_teams(G, author_skills, tasks[begin:begin + batch_size], algorithm=algorithm,
+                                      seed=seeds[begin:begin + batch_size])
+        batch_time = time.perf_counter() - start_time
+
+        for task, (team, _, _), (batch_team, _, _) in zip(tasks, single, batched):
+            assert set(team) == batch_team, f"{algorithm_name} teams differ for skills {sorted(task['skills'])}"
+
+        print(f"  {algorithm_name:<24} single {single_time:.2f}s  batched {batch_time:.2f}s"
+              f"  speedup x{single_time / max(batch_time, 1e-9):.1f}")
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Batched team formation benchmark on the collaboration graph")
+    parser.add_argument('--tasks', type=int, default=300, help='number of tasks taken from the generated tasks')
+    parser.add_argument('--batch-size', type=int, default=100, help='tasks per form_teams call')
+    parser.add_argument('--seed', type=int, default=42, help='seed of the first task, task i uses seed + i')
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    run_benchmark(args.tasks, args.batch_size, args.seed)
@@ -0,0 +1,124 @@
+import os
+import sys
+import io
+import time
+import argparse
+import contextlib
+from collections import defaultdict
+
+# add the src directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from algorithm import enhance_steiner, improved_enhance_steiner
+from algorithm.skill_index import get_skill_index
+from evaluator.evaluation import load_data
+
+CONSTRUCTIONS = ['clique', 'star']
+
+def graph_sizes(G, author_skills, T):
+    # node/edge counts of H for both modules and both constructions
+    relevant_authors = {author: author_skills[author] for author in get_skill_index(author_skills).candidates(T)
+                        if author in G}
+    sizes = {}
+    for construction in CONSTRUCTIONS:
+        H, _, _ = enhance_steiner.enhance_graph_with_cliques(G, relevant_authors, T, construction=construction)
+        sizes[("EnhanceSteiner", construction)] = (H.number_of_nodes(), H.number_of_edges())
+        # the per-task H of ImprovedEnhanceSteiner only keeps the skill nodes of T
+        gadgets, _, position = improved_enhance_steiner.get_author_gadgets(G, author_skills, construction)
+        H = improved_enhance_steiner.assemble_enhanced_graph(G, gadgets, relevant_authors, construction, position,
+                                                             skills=T)
+        improved_enhance_steiner.add_skill_terminals(H, relevant_authors, T)
+        sizes[("ImprovedEnhanceSteiner", construction)] = (H.number_of_nodes(), H.number_of_edges())
+    return sizes
+
+def rebuild_enhance_steiner(G, author_skills, T, seed):
+    # ImprovedEnhanceSteiner with the full H rebuilt from scratch for the task (clique
+    # construction), the baseline of the cached author gadgets
+    relevant_authors = {author: author_skills[author] for author in get_skill_index(author_skills).candidates(T)
+                        if author in G}
+    if not relevant_authors:
+        return set()
+    H, skill_nodes, author_skill_map = improved_enhance_steiner.enhance_graph_with_cliques(G, relevant_authors, T)
+    steiner_nodes = improved_enhance_steiner._steiner_on_enhanced_graph(H, skill_nodes, 'dijkstra', seed=seed)
+    if steiner_nodes is None:
+        return set()
+    return {author_skill_map[node] for node in steiner_nodes if node in author_skill_map}
+
+def time_rebuild(G, author_skills, T, seed):
+    # (rebuild seconds, cached seconds) for the clique construction, teams must agree
+    timings = []
+    teams = []
+    for run in (rebuild_enhance_steiner, improved_enhance_steiner.improved_enhance_steiner):
+        start_time = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            if run is rebuild_enhance_steiner:
+                team = run(G, author_skills, T, seed)
+            else:
+                team, _, _ = run(G, author_skills, T, seed=seed, components=False)
+        timings.append(time.perf_counter() - start_time)
+        teams.append(team)
+    assert teams[0] == teams[1], f"cached gadgets changed the team for skills {sorted(T)}"
+    return timings
+
+def run_benchmark(tasks_per_t, seed, include_enhance):
+    G, author_skills, tasks = load_data()
+
+    algorithms = {"ImprovedEnhanceSteiner": improved_enhance_steiner.improved_enhance_steiner}
+    if include_enhance:
+        algorithms["EnhanceSteiner"] = enhance_steiner.enhanced_steiner
+
+    tasks_by_t = defaultdict(list)
+    for task in tasks:
+        if len(tasks_by_t[task["t"]]) < tasks_per_t:
+            tasks_by_t[task["t"]].append(task)
+
+    print(f"\n Comparing clique and star constructions with {tasks_per_t} tasks per t")
+    print(" (|H| is measured over the authors holding at least one task skill)")
+
+    for t in sorted(tasks_by_t.keys()):
+        sizes = defaultdict(lambda: [0, 0])
+        timings = defaultdict(float)
+        costs = defaultdict(float)
+        rebuild = [0.0, 0.0]
+
+        for i, task in enumerate(tasks_by_t[t]):
+            T = set(task["skills"])
+            for k, seconds in enumerate(time_rebuild(G, author_skills, T, seed + i)):
+                rebuild[k] += seconds
+            for key, (nodes, edges) in graph_sizes(G, author_skills, T).items():
+                sizes[key][0] += nodes
+                sizes[key][1] += edges
+
+            for algorithm_name, algorithm_func in algorithms.items():
+                for construction in CONSTRUCTIONS:
+                    # same start terminal for both constructions
+                    start_time = time.perf_counter()
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        _, cost, _ = algorithm_func(G, author_skills, T, construction=construction, seed=seed + i)
+                    timings[(algorithm_name, construction)] += time.perf_counter() - start_time
+                    costs[(algorithm_name, construction)] += cost
+
+        n = len(tasks_by_t[t])
+        print(f"  t={t}:")
+        for algorithm_name in ["EnhanceSteiner", "ImprovedEnhanceSteiner"]:
+            for construction in CONSTRUCTIONS:
+                key = (algorithm_name, construction)
+                line = f"    {algorithm_name:<24} {construction:<6} |H| = {sizes[key][0] / n:9.0f} nodes {sizes[key][1] / n:10.0f} edges"
+                if algorithm_name in algorithms:
+                    line += f"  runtime {timings[key] / n:.4f}s  cost {costs[key] / n:.3f}"
+                print(line)
+        print(f"    ImprovedEnhanceSteiner clique per-task rebuild {rebuild[0] / n:.4f}s"
+              f"  cached gadgets {rebuild[1] / n:.4f}s  speedup x{rebuild[0] / max(rebuild[1], 1e-9):.1f}")
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Clique vs star gadget benchmark for the enhanced graph")
+    parser.add_argument('--tasks-per-t', type=int, default=3, help='number of tasks sampled for every t')
+    parser.add_argument('--seed', type=int, default=42, help='seed for the random Steiner start terminal')
+    parser.add_argument('--include-enhance', action='store_true',
+                        help='also time EnhanceSteiner end to end (slow on the full author set)')
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    run_benchmark(args.tasks_per_t, args.seed, args.include_enhance)
@@ -0,0 +1,96 @@
+import os
+import sys
+import time
+import argparse
+from collections import defaultdict
+
+# add the src directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from algorithm import steiner_tree, fast_steiner_tree
+from algorithm.cover_steiner import greedy_cover
+from algorithm.team_scoring import team_cost
+from evaluator.evaluation import load_data
+
+def tree_cost(G, tree_nodes):
+    # MST cost of the induced tree subgraph, same measure the algorithms report
+    return team_cost(G, tree_nodes)[0]
+
+def run_benchmark(module, methods, tasks_per_t, seed, n_starts=1, reduce=False, compare_reduce=False):
+    G, author_skills, tasks = load_data()
+
+    # pick the same tasks for every method
+    tasks_by_t = defaultdict(list)
+    for task in tasks:
+        if len(tasks_by_t[task["t"]]) < tasks_per_t:
+            tasks_by_t[task["t"]].append(task)
+
+    print(f"\n Benchmarking {module.__name__} methods {methods} with {tasks_per_t} tasks per t, {n_starts} start(s)")
+    # with compare_reduce every method runs on G and on the reduced graph
+    variants = [False, True] if compare_reduce else [reduce]
+
+    for t in sorted(tasks_by_t.keys()):
+        timings = defaultdict(float)
+        costs = defaultdict(float)
+
+        for i, task in enumerate(tasks_by_t[t]):
+            X0 = greedy_cover(author_skills, set(task["skills"]))
+
+            for method in methods:
+                for variant in variants:
+                    # same start terminal(s) for every method
+                    start_time = time.perf_counter()
+                    if variant:
+                        tree_nodes = module.steiner_tree_nodes(G, X0, method=method, seed=seed + i,
+                                                               n_starts=n_starts, reduce=True)
+                    else:
+                        tree_nodes = module.steiner_tree_nodes(G, X0, method=method, seed=seed + i,
+                                                               n_starts=n_starts)
+                    timings[(method, variant)] += time.perf_counter() - start_time
+                    costs[(method, variant)] += tree_cost(G, tree_nodes)
+
+        n = len(tasks_by_t[t])
+        line = f"  t={t:2d}:"
+        if compare_reduce:
+            for method in methods:
+                full, reduced = timings[(method, False)], timings[(method, True)]
+                line += (f"  {method} {full / n:.4f}s / reduced {reduced / n:.4f}s"
+                         f" (cost {costs[(method, False)] / n:.3f} / {costs[(method, True)] / n:.3f})")
+            print(line)
+            continue
+        for method in methods:
+            line += f"  {method} {timings[(method, reduce)] / n:.4f}s (cost {costs[(method, reduce)] / n:.3f})"
+        if len(methods) > 1 and timings[(methods[-1], reduce)] > 0:
+            line += f"  speedup x{timings[(methods[0], reduce)] / timings[(methods[-1], reduce)]:.1f}"
+        print(line)
+
+    if compare_reduce:
+        total = {variant: sum(timings[(method, variant)] for method in methods) for variant in variants}
+        print(f"  total: full {total[False]:.2f}s  reduced {total[True]:.2f}s"
+              f"  speedup x{total[False] / max(total[True], 1e-9):.1f}")
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Steiner tree engine benchmark on the collaboration graph")
+    parser.add_argument('--module', choices=['steiner_tree', 'fast_steiner_tree'], default='steiner_tree',
+                        help='Steiner module to benchmark')
+    parser.add_argument('--methods', nargs='+', default=['pairwise', 'dijkstra'],
+                        help='methods to compare, the first one is the speedup baseline')
+    parser.add_argument('--tasks-per-t', type=int, default=5, help='number of tasks sampled for every t')
+    parser.add_argument('--seed', type=int, default=42, help='seed for the random start terminal')
+    parser.add_argument('--n-starts', type=int, default=1,
+                        help='start terminals per Steiner tree, the cheapest tree is kept')
+    parser.add_argument('--reduce', action='store_true',
+                        help='search the reduced graph (steiner_tree module only)')
+    parser.add_argument('--compare-reduce', action='store_true',
+                        help='time every method on G and on the reduced graph (steiner_tree module only)')
+    args = parser.parse_args()
+    if (args.reduce or args.compare_reduce) and args.module != 'steiner_tree':
+        parser.error("--reduce is only supported by the steiner_tree module")
+    return args
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    module = steiner_tree if args.module == 'steiner_tree' else fast_steiner_tree
+    run_benchmark(module, args.methods, args.tasks_per_t, args.seed, args.n_starts, args.reduce,
+                  args.compare_reduce)
@@ -0,0 +1,162 @@
+from .cover_steiner import cover_steiner, greedy_cover
+from .graph_aware_cover_steiner import graph_aware_cover_steiner, graph_aware_greedy_cover
+from .improved_enhance_steiner import improved_enhance_steiner
+from .steiner_tree import steiner_tree_nodes
+from .skill_index import get_skill_index
+from .team_scoring import team_cost
+from .multi_start import make_rng, draw_starts
+from .exact_steiner import fits_exact
+from .component_index import get_component_index, task_authors
+from .spt_cache import ShortestPathTreeCache, resolve_spt_cache
+
+# Batch team formation: many tasks against one (G, author_skills) pair.
+# Work shared across the batch:
+#   - one skill index, and one shortest path tree cache (the shared one when enabled,
+#     otherwise a cache kept for this batch only) whose trees rooted at team centers and
+#     terminals are reused by later tasks
+#   - covers and Steiner trees of repeated skill sets / terminal sets are computed once
+# Tasks are processed group by group (tasks connected through shared skills) so the
+# trees of a group are still cached when its next task needs them. Random Steiner
+# start terminals are drawn in input order, so every team equals the one the
+# single-call function returns for the same sequence of calls.
+
+def _task_skills(task):
+    # tasks may be generated task dicts or plain skill sets
+    return set(task["skills"]) if isinstance(task, dict) else set(task)
+
+def group_tasks(skill_sets):
+    # Union tasks that share a skill, returns groups of task indices in input order
+    parent = list(range(len(skill_sets)))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    owner = {}  # skill -> first task index holding it
+    for i, skills in enumerate(skill_sets):
+        for skill in skills:
+            if skill in owner:
+                parent[find(i)] = find(owner[skill])
+            else:
+                owner[skill] = i
+
+    groups = {}
+    for i in range(len(skill_sets)):
+        groups.setdefault(find(i), []).append(i)
+    return list(groups.values())
+
+def _communication_cost(G, team):
+    # MST cost over the team, as computed at the end of the single-call algorithms
+    mst_cost, is_connected = team_cost(G, team)
+    if team and not is_connected:
+        print("Team members are not connected, unable to compute mst cost")
+
+    return mst_cost, is_connected
+
+def _task_seed(seed, i):
+    # seed is None, one seed for every task or a sequence of per-task seeds
+    if isinstance(seed, (list, tuple)):
+        return seed[i]
+    return seed
+
+def _cover_then_steiner(G, author_skills, skill_sets, cover, method, oracle, rng=None, seed=None, n_starts=1,
+                        reduce=False, spt_cache=None):
+    # Shared pipeline of CoverSteiner and GraphAwareCoverSteiner
+    groups = group_tasks(skill_sets)
+
+    # 1) covers, identical skill sets are covered once
+    covers = [None] * len(skill_sets)
+    cover_memo = {}
+    for group in groups:
+        for i in group:
+            key = frozenset(skill_sets[i])
+            if key not in cover_memo:
+                cover_memo[key] = cover(skill_sets[i])
+            covers[i] = cover_memo[key]
+
+    # 2) start terminals in input order, the same random draws as consecutive single calls
+    # (a seed gives every call a fresh Random(seed), an rng is shared by the calls;
+    # 'exact' draws one only when the terminal set falls back to 'dijkstra')
+    starts = [None] * len(skill_sets)
+    if method in ('dijkstra', 'pairwise', 'exact'):
+        for i, X0 in enumerate(covers):
+            if X0 and (method != 'exact' or not fits_exact(G, X0)):
+                starts[i] = tuple(draw_starts(X0, make_rng(rng, _task_seed(seed, i)), n_starts))
+
+    # 3) Steiner trees, identical (terminals, start) pairs are solved once
+    results = [None] * len(skill_sets)
+    tree_memo = {}
+    for group in groups:
+        for i in group:
+            key = (frozenset(covers[i]), starts[i])
+            if key not in tree_memo:
+                team = steiner_tree_nodes(G, covers[i], method=method, oracle=oracle, starts=starts[i], reduce=reduce,
+                                          spt_cache=spt_cache)
+                tree_memo[key] = (team, *_communication_cost(G, team))
+            team, mst_cost, is_connected = tree_memo[key]
+            results[i] = (set(team), mst_cost, is_connected)
+
+    return results
+
+def form_teams(G, author_skills, tasks, algorithm=cover_steiner, method='dijkstra', oracle=None,
+               construction='clique', rng=None, seed=None, n_starts=1, reduce=False, components=None,
+               spt_cache=None):
+    # Teams for many tasks at once, returns [(team, cost, is_connected), ...] in task order.
+    # algorithm is one of cover_steiner, graph_aware_cover_steiner, improved_enhance_steiner.
+    # rng, seed, n_starts and reduce are passed on as in the single-call functions, seed
+    # may also be a list with one seed per task. reduce does not apply to the enhanced graph.
+    # components: as in the single calls, a task no component can cover gets (set(), 0, False)
+    # spt_cache: None uses the shared cache when enabled and otherwise a cache dropped after
+    # this call, False runs the bounded searches of the single calls, a cache object is used
+    # as given. Full trees pay off on small graphs; on large ones pass False.
+    skill_sets = [_task_skills(task) for task in tasks]
+    index = get_skill_index(author_skills)
+    if components is None:
+        components = get_component_index(G, author_skills)
+    cache = resolve_spt_cache(spt_cache)
+    if cache is None and spt_cache is None:
+        cache = ShortestPathTreeCache()
+    cache = cache or False
+
+    if algorithm is cover_steiner:
+        def cover(T):
+            authors = task_authors(components or None, T)
+            if authors is not None and not authors:
+                return set()
+            return greedy_cover(author_skills, T, index=index, authors=authors)
+        return _cover_then_steiner(G, author_skills, skill_sets, cover, method, oracle, rng, seed, n_starts, reduce,
+                                   cache)
+
+    if algorithm is graph_aware_cover_steiner:
+        def cover(T):
+            authors = task_authors(components or None, T)
+            if authors is not None and not authors:
+                return set()
+            return graph_aware_greedy_cover(G, author_skills, T, oracle=oracle, index=index, authors=authors,
+                                            spt_cache=cache)
+        return _cover_then_steiner(G, author_skills, skill_sets, cover, method, oracle, rng, seed, n_starts, reduce,
+                                   cache)
+
+    if algorithm is improved_enhance_steiner:
+        # the enhanced base graph is already shared through its cache; the Steiner start
+        # is drawn inside, so tasks run in input order and only deterministic runs
+        # (mehlhorn or a fixed seed) reuse the result of a repeated skill set
+        results = []
+        memo = {}
+        for i, T in enumerate(skill_sets):
+            task_seed = _task_seed(seed, i)
+            key = (frozenset(T), task_seed)
+            if (method == 'mehlhorn' or (task_seed is not None and rng is None)) and key in memo:
+                team, mst_cost, is_connected = memo[key]
+            else:
+                team, mst_cost, is_connected = improved_enhance_steiner(G, author_skills, T, method=method,
+                                                                        construction=construction, rng=rng,
+                                                                        seed=task_seed, n_starts=n_starts,
+                                                                        components=components)
+                memo[key] = (team, mst_cost, is_connected)
+            results.append((set(team), mst_cost, is_connected))
+        return results
+
+    raise ValueError("algorithm must be cover_steiner, graph_aware_cover_steiner or improved_enhance_steiner")
@@ -0,0 +1,88 @@
+from collections import defaultdict
+import numpy as np
+import networkx as nx
+from .skill_index import get_skill_index
+
+class ComponentIndex:
+    # Connected components of G: one label per node (an array over G's node order), the
+    # members of every component and the skills its authors hold as a bitmask over the
+    # SkillIndex ids. A task can be checked against it with a few set intersections
+    # before any path search.
+
+    def __init__(self, G, author_skills, index=None):
+        self.index = index or get_skill_index(author_skills)
+        self.nodes = list(G.nodes())
+        self.position = {node: i for i, node in enumerate(self.nodes)}
+        self.labels = np.full(len(self.nodes), -1, dtype=np.int32)
+        self.members = []                           # label -> frozenset of nodes
+        for label, component in enumerate(nx.connected_components(G)):
+            self.labels[[self.position[node] for node in component]] = label
+            self.members.append(frozenset(component))
+
+        self.masks = [0] * len(self.members)        # label -> skills of its authors
+        for author, mask in self.index.author_masks.items():
+            i = self.position.get(author)
+            if i is not None:
+                self.masks[self.labels[i]] |= mask
+
+        self.skill_components = defaultdict(set)    # skill id -> labels holding it
+        for label, mask in enumerate(self.masks):
+            while mask:
+                low = mask & -mask
+                self.skill_components[low.bit_length() - 1].add(label)
+                mask ^= low
+
+        self.size = (G.number_of_nodes(), G.number_of_edges(), len(author_skills))
+
+    def label(self, node):
+        i = self.position.get(node)
+        return None if i is None else int(self.labels[i])
+
+    def connected(self, nodes):
+        # whether all nodes lie in one component
+        return len({self.label(node) for node in nodes}) <= 1
+
+    def covering_components(self, T):
+        # labels of the components whose authors hold every skill of T, largest first
+        sets = []
+        for skill in T:
+            skill_id = self.index.skill_ids.get(skill)
+            if skill_id is None:
+                return []
+            sets.append(self.skill_components[skill_id])
+        if not sets:
+            return list(range(len(self.members)))
+
+        sets.sort(key=len)
+        labels = set(sets[0]).intersection(*sets[1:])
+        return sorted(labels, key=lambda label: (-len(self.members[label]), label))
+
+def task_authors(components, T, single=True):
+    # Authors a team for T may be drawn from: the largest component holding every skill
+    # of T (single=True, for the greedy covers) or all such components (single=False).
+    # None without a component index, an empty set when no component covers T.
+    if components is None:
+        return None
+    labels = components.covering_components(T)
+    if not labels:
+        print(f"No connected component covers all skills: {sorted(T)}")
+        return frozenset()
+    if single or len(labels) == 1:
+        return components.members[labels[0]]
+    return frozenset().union(*(components.members[label] for label in labels))
+
+# one index per (G, author_skills) pair, shared by every algorithm call on that dataset
+_component_cache = {}
+
+def get_component_index(G, author_skills):
+    key = (id(G), id(author_skills))
+    size = (G.number_of_nodes(), G.number_of_edges(), len(author_skills))
+    cached = _component_cache.get(key)
+    if cached is not None and cached[0] is G and cached[1] is author_skills and cached[2].size == size:
+        return cached[2]
+
+    if len(_component_cache) >= 4:
+        _component_cache.clear()
+    components = ComponentIndex(G, author_skills)
+    _component_cache[key] = (G, author_skills, components)
+    return components
@@ -1,65 +1,73 @@
-import networkx as nx
-from collections import defaultdict
+import heapq
 from .steiner_tree import steiner_tree_nodes
+from .skill_index import get_skill_index, popcount
+from .team_scoring import team_cost
+from .component_index import get_component_index, task_authors
+
+def greedy_cover(author_skills, T, index=None, authors=None):
+    # authors: only these authors may be chosen (e.g. one connected component)
 
-def greedy_cover(author_skills, T):
-   
     # Initialize
-    covered_skills = set()  # covered skills as set
+    index = index or get_skill_index(author_skills)
+    target = index.mask(T)  # needed skills as bitmask
+    covered = 0             # covered skills as bitmask
     team = set()            # final team
-    
-    # Add authors who have skills
-    skill_authors = defaultdict(set)
-    for author, skills in author_skills.items():
-        for skill in skills:
-            if skill in T:  # focus on needed skills
-                skill_authors[skill].add(author)
-    
+
+    # Only authors holding a needed skill, in a max-heap of marginal gains.
+    # Gains only shrink, so a popped entry whose gain is still current is the best
+    # choice (ties go to the earlier author, like a scan over author_skills).
+    heap = [(-popcount(index.author_masks[author] & target), index.author_order[author], author)
+            for author in index.candidates(T) if authors is None or author in authors]
+    heapq.heapify(heap)
+
     # Keep iterating if skills are not fully covered
-    while covered_skills != T:
+    while covered != target:
         best_author = None
-        best_new_skills = set()
-        
-        # find author who covered most new skills
-        for author, skills in author_skills.items():
-            if author in team:  # skip the chosen
-                continue
-                
-            new_skills = (skills & T) - covered_skills  # new skills from authors
-            
-            # update the better choices of skill
-            if len(new_skills) > len(best_new_skills):
+
+        while heap:
+            neg_gain, order, author = heapq.heappop(heap)
+            gain = popcount(index.author_masks[author] & target & ~covered)
+            if gain == 0:
+                continue  # nothing new from this author anymore
+            if gain == -neg_gain:
                 best_author = author
-                best_new_skills = new_skills
-        
+                break
+            heapq.heappush(heap, (-gain, order, author))
+
         # If no appropriate author, exit
         if best_author is None:
-            print(f"Cannot cover skills: {T - covered_skills}")
             break
-        
+
         # add author and update the skills
         team.add(best_author)
-        covered_skills |= best_new_skills
-    
+        covered |= index.author_masks[best_author] & target
+
+    uncovered_skills = set(T) - index.skills_of(covered)
+    if uncovered_skills:
+        print(f"Cannot cover skills: {uncovered_skills}")
+
     return team
 
-def cover_steiner(G, author_skills, T):
+def cover_steiner(G, author_skills, T, method='dijkstra', oracle=None, spt_cache=None, rng=None, seed=None,
+                  n_starts=1, reduce=False, components=None):
+    # components: None uses the shared component index, False skips the check
+
+    # Fail fast when no connected component can cover T, otherwise cover inside one
+    components = get_component_index(G, author_skills) if components is None else components or None
+    authors = task_authors(components, T)
+    if authors is not None and not authors:
+        return set(), 0, False
 
     # Greedy cover
-    X0 = greedy_cover(author_skills, T)
+    X0 = greedy_cover(author_skills, T, authors=authors)
     
     # SteinerTree
-    team = steiner_tree_nodes(G, X0) 
+    team = steiner_tree_nodes(G, X0, method=method, oracle=oracle, spt_cache=spt_cache, rng=rng, seed=seed,
+                              n_starts=n_starts, reduce=reduce)
     
     # Communication cost
-    subgraph = G.subgraph(team)
-    is_connected = nx.is_connected(subgraph)
-    mst_cost = 0
-    
-    if is_connected:
-        mst = nx.minimum_spanning_tree(subgraph)
-        mst_cost = sum(data['weight'] for _, _, data in mst.edges(data=True))
-    else:
+    mst_cost, is_connected = team_cost(G, team)
+    if not is_connected:
         print("Team members are not connected, unable to compute mst cost")
     
     return team, mst_cost, is_connected
\ No newline at end of file
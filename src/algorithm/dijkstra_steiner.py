@@ -0,0 +1,80 @@
+import numpy as np
+from .shortest_paths import multi_source_dijkstra
+
+def grow_steiner_tree(G, required_nodes, start, weight="weight"):
+    # Takahashi-Matsuyama growth: every iteration runs one multi-source Dijkstra
+    # from the whole current tree, stops at the nearest uncovered terminal and
+    # attaches it through the predecessor map of that same search.
+    tree_nodes = {start}
+    tree_edges = []  # (u, v, weight) edges in the order they were attached
+
+    uncovered = set(required_nodes)
+    uncovered.discard(start)
+
+    while uncovered:
+        # sources in string order, so equal distances are settled in the same order in every process
+        dist, pred, reached = multi_source_dijkstra(G, sorted(tree_nodes, key=str), targets=uncovered,
+                                                    weight=weight)
+        if reached is None:
+            break
+
+        # walk back until we hit the tree, every node on the way joins the tree
+        node = reached
+        while node not in tree_nodes:
+            parent = pred[node]
+            tree_edges.append((parent, node, G[parent][node].get(weight, 1)))
+            tree_nodes.add(node)
+            uncovered.discard(node)
+            node = parent
+
+    return tree_nodes, tree_edges, uncovered
+
+def grow_steiner_tree_cached(G, required_nodes, start, cache, weight="weight"):
+    # Same Takahashi-Matsuyama growth, driven by shortest path trees rooted at the
+    # terminals. Those trees come from the shared cache, so a terminal that shows up
+    # again (later iteration, later task) costs no new Dijkstra.
+    nodes, index, _ = cache.graph_arrays(G)
+    uncovered = set(required_nodes)
+    uncovered.discard(start)
+    if start not in index:
+        return {start}, [], uncovered
+
+    tree_nodes = {start}
+    tree_index = [index[start]]
+    tree_edges = []
+
+    while uncovered:
+        # nearest (terminal, tree node) pair from the terminals' distance arrays
+        best_terminal = None
+        best_anchor = None
+        best_length = float('inf')
+        anchors = np.asarray(tree_index)
+        for terminal in sorted(uncovered, key=str):
+            if terminal not in index:
+                continue
+            dist, _ = cache.tree(G, terminal)
+            lengths = dist[anchors]
+            i = int(np.argmin(lengths))
+            if lengths[i] < best_length:
+                best_length = lengths[i]
+                best_terminal = terminal
+                best_anchor = anchors[i]
+
+        if best_terminal is None:
+            break
+
+        # walk from the anchor towards the terminal, attaching after the last tree node
+        _, pred = cache.tree(G, best_terminal)
+        path = [best_anchor]
+        while path[-1] != index[best_terminal]:
+            path.append(int(pred[path[-1]]))
+        path = [nodes[i] for i in path]
+        last_tree_node = max(i for i, node in enumerate(path) if node in tree_nodes)
+
+        for parent, node in zip(path[last_tree_node:], path[last_tree_node + 1:]):
+            tree_edges.append((parent, node, G[parent][node].get(weight, 1)))
+            tree_nodes.add(node)
+            tree_index.append(index[node])
+            uncovered.discard(node)
+
+    return tree_nodes, tree_edges, uncovered
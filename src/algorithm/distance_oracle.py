@@ -0,0 +1,203 @@
+import os
+import json
+import heapq
+import itertools
+import numpy as np
+import networkx as nx
+
+# All oracles answer the same queries:
+#   distance(u, v)      exact shortest path length (inf if unreachable)
+#   lower_bound(u, v)   cheap admissible lower bound on distance(u, v)
+#   shortest_path(u, v) node list of one shortest path
+# lookup tells whether distance() is a table lookup (cheap enough to rank every
+# candidate pair) or a search of its own.
+
+def _graph_fingerprint(G, weight="weight"):
+    # cheap identity check so a stored oracle is not reused for another graph
+    total_weight = sum(data.get(weight, 1) for _, _, data in G.edges(data=True))
+    return [G.number_of_nodes(), G.number_of_edges(), round(float(total_weight), 6)]
+
+def _single_source_lengths(G, source, index, weight="weight"):
+    # Dijkstra from source, distances written into a float32 row (inf = unreachable)
+    row = np.full(len(index), np.inf, dtype=np.float32)
+    for node, length in nx.single_source_dijkstra_path_length(G, source, weight=weight).items():
+        row[index[node]] = length
+    return row
+
+class ExactDistanceOracle:
+    # All-pairs shortest path lengths as a float32 matrix, memory-mapped when loaded from disk
+    lookup = True
+
+    def __init__(self, G, nodes, matrix):
+        self.G = G
+        self.nodes = nodes
+        self.index = {node: i for i, node in enumerate(nodes)}
+        self.matrix = matrix
+
+    @classmethod
+    def build(cls, G, weight="weight"):
+        nodes = list(G.nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        matrix = np.empty((len(nodes), len(nodes)), dtype=np.float32)
+        for i, node in enumerate(nodes):
+            matrix[i] = _single_source_lengths(G, node, index, weight)
+        return cls(G, nodes, matrix)
+
+    def distance(self, u, v):
+        if u not in self.index or v not in self.index:
+            return float('inf')
+        return float(self.matrix[self.index[u], self.index[v]])
+
+    def lower_bound(self, u, v):
+        # shave the float32 rounding so the bound stays admissible
+        return self.distance(u, v) * (1 - 1e-6)
+
+    def shortest_path(self, u, v):
+        return nx.astar_path(self.G, u, v, heuristic=self.lower_bound, weight="weight")
+
+    def save(self, directory, fingerprint):
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "apsp.npy"), self.matrix)
+        _save_meta(directory, "exact", self.nodes, fingerprint)
+
+    @classmethod
+    def load(cls, G, directory, nodes):
+        matrix = np.load(os.path.join(directory, "apsp.npy"), mmap_mode='r')
+        return cls(G, nodes, matrix)
+
+class LandmarkDistanceOracle:
+    # ALT index: distances from a few landmarks give triangle-inequality lower
+    # bounds |d(l, u) - d(l, v)|, exact queries run A* guided by those bounds
+    lookup = False
+
+    def __init__(self, G, nodes, landmark_distances):
+        self.G = G
+        self.nodes = nodes
+        self.index = {node: i for i, node in enumerate(nodes)}
+        self.landmark_distances = landmark_distances  # (num_landmarks, num_nodes)
+
+    @classmethod
+    def build(cls, G, num_landmarks=16, weight="weight"):
+        nodes = list(G.nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        if not nodes:
+            return cls(G, nodes, np.empty((0, 0), dtype=np.float32))
+
+        # farthest-point selection, starting from the best connected author
+        rows = []
+        closest = np.full(len(nodes), np.inf, dtype=np.float32)
+        landmark = max(nodes, key=G.degree)
+        for _ in range(min(num_landmarks, len(nodes))):
+            row = _single_source_lengths(G, landmark, index, weight)
+            rows.append(row)
+            closest = np.minimum(closest, row)
+            # unreachable nodes (inf) come first so every component gets a landmark
+            landmark = nodes[int(np.argmax(closest))]
+            if closest[index[landmark]] == 0:
+                break
+
+        return cls(G, nodes, np.vstack(rows))
+
+    def lower_bound(self, u, v):
+        if u not in self.index or v not in self.index:
+            return float('inf')
+        du = self.landmark_distances[:, self.index[u]]
+        dv = self.landmark_distances[:, self.index[v]]
+        # a landmark reaching exactly one of the two proves they are disconnected
+        if np.any(np.isfinite(du) != np.isfinite(dv)):
+            return float('inf')
+        both = np.isfinite(du)
+        if not both.any():
+            return 0.0
+        # shaved like ExactDistanceOracle.lower_bound against float32 rounding
+        return float(np.max(np.abs(du[both] - dv[both]))) * (1 - 1e-6)
+
+    def distance(self, u, v):
+        return self._astar(u, v)[0]
+
+    def shortest_path(self, u, v):
+        _, path = self._astar(u, v)
+        if path is None:
+            raise nx.NetworkXNoPath(f"No path between {u} and {v}.")
+        return path
+
+    def _astar(self, source, target):
+        if source not in self.index or target not in self.index:
+            return float('inf'), None
+        if self.lower_bound(source, target) == float('inf'):
+            return float('inf'), None
+
+        # landmark distances of the target, reused for every heuristic evaluation
+        target_column = self.landmark_distances[:, self.index[target]]
+        finite = np.isfinite(target_column)
+        target_column = target_column[finite]
+
+        def heuristic(node):
+            # shaved like ExactDistanceOracle.lower_bound against float32 rounding
+            column = self.landmark_distances[finite, self.index[node]]
+            return float(np.max(np.abs(column - target_column))) * (1 - 1e-6) if len(column) else 0.0
+
+        counter = itertools.count()
+        heap = [(heuristic(source), next(counter), 0, source)]
+        best = {source: 0}
+        pred = {source: None}
+        settled = set()
+
+        while heap:
+            _, _, d, u = heapq.heappop(heap)
+            if u in settled:
+                continue
+            if u == target:
+                path = [u]
+                while pred[path[-1]] is not None:
+                    path.append(pred[path[-1]])
+                return d, path[::-1]
+            settled.add(u)
+
+            for v, data in self.G[u].items():
+                vd = d + data.get("weight", 1)
+                if v not in best or vd < best[v]:
+                    best[v] = vd
+                    pred[v] = u
+                    heapq.heappush(heap, (vd + heuristic(v), next(counter), vd, v))
+
+        return float('inf'), None
+
+    def save(self, directory, fingerprint):
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "landmarks.npy"), self.landmark_distances)
+        _save_meta(directory, "landmark", self.nodes, fingerprint)
+
+    @classmethod
+    def load(cls, G, directory, nodes):
+        landmark_distances = np.load(os.path.join(directory, "landmarks.npy"), mmap_mode='r')
+        return cls(G, nodes, landmark_distances)
+
+def _save_meta(directory, kind, nodes, fingerprint):
+    with open(os.path.join(directory, "oracle_meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"kind": kind, "fingerprint": fingerprint, "nodes": nodes}, f, ensure_ascii=False)
+
+def build_distance_oracle(G, max_exact_nodes=5000, num_landmarks=16):
+    # exact APSP for small graphs, landmark lower bounds for large ones
+    if G.number_of_nodes() <= max_exact_nodes:
+        return ExactDistanceOracle.build(G)
+    return LandmarkDistanceOracle.build(G, num_landmarks=num_landmarks)
+
+def load_distance_oracle(G, directory, max_exact_nodes=5000, num_landmarks=16):
+    # Load the oracle stored in directory, (re)building it when missing or built for another graph
+    fingerprint = _graph_fingerprint(G)
+    meta_path = os.path.join(directory, "oracle_meta.json")
+
+    if os.path.exists(meta_path):
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta["fingerprint"] == fingerprint:
+            oracle_cls = ExactDistanceOracle if meta["kind"] == "exact" else LandmarkDistanceOracle
+            print(f" Loaded {meta['kind']} distance oracle from {directory}")
+            return oracle_cls.load(G, directory, meta["nodes"])
+
+    print(f" Building distance oracle for {G.number_of_nodes()} nodes...")
+    oracle = build_distance_oracle(G, max_exact_nodes=max_exact_nodes, num_landmarks=num_landmarks)
+    oracle.save(directory, fingerprint)
+    print(f" Distance oracle saved to {directory}")
+    return oracle
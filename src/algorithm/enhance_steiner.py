@@ -1,59 +1,83 @@
 from collections import defaultdict
 import networkx as nx
 from .steiner_tree import steiner_tree_graph
+from .team_scoring import team_cost
+
+def enhance_graph_with_cliques(G, author_skills, T, D=1e9, construction='clique'):
+    # construction='clique': zero-weight edges between every pair of an author's skill nodes
+    # construction='star': one zero-weight spoke from every skill node to an author hub.
+    # Both give distance 0 between any two nodes of the same author and the same
+    # cross-author distances, so Steiner tree costs are identical.
+    if construction not in ('clique', 'star'):
+        raise ValueError("construction must be 'clique' or 'star'")
 
-def enhance_graph_with_cliques(G, author_skills, T, D=1e9):
     H = nx.Graph()
     author_rep_map = {}  # save author::skill → author mapping
     skill_nodes = set()
     author_clique_map = defaultdict(list)  # save each author's clique node list
+    author_hub_map = {}  # author → hub node (star construction)
 
     # Create author representative nodes (split by skill)
     for author, skills in author_skills.items():
-        # create a clique for each author with their skills
-        for skill in skills:
+        # create a clique for each author with their skills (sorted, so node order and
+        # tie-breaking do not depend on string hashing)
+        for skill in sorted(skills):
             node_name = f"author::{author}::{skill}"
             H.add_node(node_name)
             author_rep_map[node_name] = author
             author_clique_map[author].append(node_name)
 
-    # Build clique internal connections (edge weight is 0)
-    for author, nodes in author_clique_map.items():
-        # Fully connect all nodes within the clique
-        for i in range(len(nodes)):
-            for j in range(i + 1, len(nodes)):
-                H.add_edge(nodes[i], nodes[j], weight=0)
+    if construction == 'clique':
+        # Build clique internal connections (edge weight is 0)
+        for author, nodes in author_clique_map.items():
+            # Fully connect all nodes within the clique
+            for i in range(len(nodes)):
+                for j in range(i + 1, len(nodes)):
+                    H.add_edge(nodes[i], nodes[j], weight=0)
+
+        # Inherit original graph edge structure
+        for u, v, data in G.edges(data=True):
+            weight = data.get("weight", 1.0)
+            # Connect all clique nodes of the two authors
+            for u_node in author_clique_map.get(u, []):
+                for v_node in author_clique_map.get(v, []):
+                    H.add_edge(u_node, v_node, weight=weight)
+    else:
+        # Hub per author with zero-weight spokes to its skill nodes
+        for author, nodes in author_clique_map.items():
+            hub = f"hub::{author}"
+            author_hub_map[author] = hub
+            author_rep_map[hub] = author
+            for node in nodes:
+                H.add_edge(hub, node, weight=0)
 
-    # Inherit original graph edge structure
-    for u, v, data in G.edges(data=True):
-        weight = data.get("weight", 1.0)
-        # Connect all clique nodes of the two authors
-        for u_node in author_clique_map.get(u, []):
-            for v_node in author_clique_map.get(v, []):
-                H.add_edge(u_node, v_node, weight=weight)
+        # one edge between the two hubs replaces all skill node pairs
+        for u, v, data in G.edges(data=True):
+            if u in author_hub_map and v in author_hub_map:
+                H.add_edge(author_hub_map[u], author_hub_map[v], weight=data.get("weight", 1.0))
 
     # Add virtual skill nodes and connections 
-    for skill in T:
+    for skill in sorted(T):
         skill_node = f"skill::{skill}"
         H.add_node(skill_node)
         skill_nodes.add(skill_node)
 
-        # Connect all clique nodes of the two authors
+        # Connect the skill node to every author's node for this skill
         for author in author_skills:
             if skill in author_skills[author]:
-                # Find the node corresponding to this skill for the author
-                for node in author_clique_map[author]:
-                    if node.endswith(f"::{skill}"):
-                        H.add_edge(skill_node, node, weight=D)
+                H.add_edge(skill_node, f"author::{author}::{skill}", weight=D)
     
     return H, skill_nodes, author_rep_map
 
-def enhanced_steiner(G, author_skills, T):
+def enhanced_steiner(G, author_skills, T, method='dijkstra', construction='clique', rng=None, seed=None,
+                     n_starts=1):
     # Create enhanced graph H 
-    H, skill_nodes, author_skill_map = enhance_graph_with_cliques(G, author_skills, T)
+    H, skill_nodes, author_skill_map = enhance_graph_with_cliques(G, author_skills, T, construction=construction)
 
     # use Steiner Tree to cover skill nodes
-    steiner_tree_subgraph = steiner_tree_graph(H, skill_nodes)  
+    # H is rebuilt for every task, shortest path trees over it would never be reused
+    steiner_tree_subgraph = steiner_tree_graph(H, skill_nodes, method=method, spt_cache=False, rng=rng, seed=seed,
+                                               n_starts=n_starts)
     steiner_nodes = set(steiner_tree_subgraph.nodes())
 
     team = {author_skill_map[node] for node in steiner_nodes if node in author_skill_map}
@@ -62,12 +86,6 @@ def enhanced_steiner(G, author_skills, T):
     if not team:
         return set(), 0, False
         
-    subgraph = G.subgraph(team)
-    is_connected = nx.is_connected(subgraph) if len(team) > 1 else True
-    mst_cost = 0
-
-    if is_connected and len(team) > 1:
-        mst = nx.minimum_spanning_tree(subgraph)
-        mst_cost = sum(data['weight'] for _, _, data in mst.edges(data=True))
+    mst_cost, is_connected = team_cost(G, team)
 
     return team, mst_cost, is_connected
\ No newline at end of file
@@ -0,0 +1,143 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import dijkstra, connected_components
+from .spt_cache import ShortestPathTreeCache, NO_PREDECESSOR
+
+# Exact Steiner trees for small terminal sets (Dreyfus-Wagner / Erickson-Monma-Veinott).
+# One terminal q is the root; for every subset S of the other terminals
+#   cost[S][v] = cheapest tree spanning S and node v
+# is built from
+#   merge: min over splits S = A | B of cost[A][v] + cost[B][v]   (NumPy, all v at once)
+#   grow:  one multi-source Dijkstra seeded with the merged costs  (scipy csgraph, via a
+#          super source whose edge to v weighs cost[S][v])
+# and the optimum is cost[all][q]. Time and memory grow with 2^k * n, so terminal sets
+# larger than max_terminals (or tables above max_table_bytes) are left to the heuristics.
+
+EXACT_MAX_TERMINALS = 10
+EXACT_MAX_TABLE_BYTES = 512 << 20
+
+_limits = {"max_terminals": EXACT_MAX_TERMINALS, "max_table_bytes": EXACT_MAX_TABLE_BYTES}
+
+def configure_exact_steiner(max_terminals=EXACT_MAX_TERMINALS, max_table_bytes=EXACT_MAX_TABLE_BYTES):
+    # terminal count / table size above which steiner_tree(method='exact') falls back
+    _limits.update(max_terminals=max_terminals, max_table_bytes=max_table_bytes)
+
+def fits_exact(G, required_nodes, max_terminals=None, max_table_bytes=None):
+    # whether exact_steiner_tree solves this terminal set (else steiner_tree falls back).
+    # cost, split and pred tables hold a float64 and two int32 per (subset, node)
+    max_terminals = _limits["max_terminals"] if max_terminals is None else max_terminals
+    max_table_bytes = _limits["max_table_bytes"] if max_table_bytes is None else max_table_bytes
+    k = sum(1 for node in required_nodes if node in G)
+    return k <= max_terminals and (1 << max(k - 1, 0)) * G.number_of_nodes() * 16 <= max_table_bytes
+
+def _component_graph(G, terminals, cache):
+    # CSR of the connected component holding the most terminals, its node list and the
+    # terminals inside it (sorted)
+    nodes, index, matrix = cache.graph_arrays(G)
+    _, labels = connected_components(matrix, directed=False)
+    largest = np.argmax(np.bincount(labels[[index[t] for t in terminals]]))
+    component = np.flatnonzero(labels == largest)
+    sub = matrix[component][:, component].tocsr()
+    sub_nodes = [nodes[i] for i in component]
+    position = {node: i for i, node in enumerate(sub_nodes)}
+    inside = [t for t in terminals if labels[index[t]] == largest]
+    return sub, sub_nodes, position, inside
+
+def _with_super_source(matrix):
+    # (n+1)x(n+1) CSR whose last row links a super source to every node, the row's
+    # data (matrix.data[-n:]) is overwritten with the merged costs before each Dijkstra
+    n = matrix.shape[0]
+    indptr = np.concatenate([matrix.indptr, [matrix.indptr[-1] + n]])
+    indices = np.concatenate([matrix.indices, np.arange(n)])
+    data = np.concatenate([matrix.data, np.zeros(n)])
+    return sp.csr_matrix((data, indices, indptr), shape=(n + 1, n + 1))
+
+def _submasks(S):
+    # proper non-empty subsets A of S holding S's lowest bit (each split counted once)
+    low = S & -S
+    rest = S ^ low
+    masks = []
+    sub = rest
+    while True:
+        if low | sub != S:
+            masks.append(low | sub)
+        if sub == 0:
+            break
+        sub = (sub - 1) & rest
+    return np.array(masks, dtype=np.int64)
+
+def exact_steiner_tree(G, required_nodes, weight="weight", cache=None, max_terminals=None, max_table_bytes=None):
+    # Minimum Steiner tree over required_nodes, returns (tree_nodes, tree_edges, uncovered)
+    # like the heuristics, or None when the terminal set is too large for the DP.
+    # Terminals outside the component holding most of them are reported as uncovered.
+    # cache: shortest path tree cache whose CSR of G is reused (default: a private one)
+    if not fits_exact(G, required_nodes, max_terminals, max_table_bytes):
+        return None
+
+    terminals = sorted((node for node in required_nodes if node in G), key=str)
+    if not terminals:
+        return set(), [], set(required_nodes)
+
+    cache = cache if cache is not None else ShortestPathTreeCache(max_graphs=1)
+    matrix, nodes, position, terminals = _component_graph(G, terminals, cache)
+    uncovered = set(required_nodes) - set(terminals)
+    if len(terminals) == 1:
+        return set(terminals), [], uncovered
+
+    n = len(nodes)
+    k = len(terminals) - 1  # DP terminals, the last terminal is the root
+    full = (1 << k) - 1
+
+    cost = np.full((full + 1, n), np.inf)
+    split = np.zeros((full + 1, n), dtype=np.int32)      # merge split A at v (0 = none)
+    pred = np.full((full + 1, n), NO_PREDECESSOR, dtype=np.int32)
+
+    # singletons: shortest path trees of the DP terminals
+    sources = [position[t] for t in terminals[:k]]
+    dist, single_pred = dijkstra(matrix, indices=sources, return_predecessors=True)
+    for i in range(k):
+        cost[1 << i] = dist[i]
+        pred[1 << i] = single_pred[i]
+
+    augmented = _with_super_source(matrix)
+    row = slice(augmented.indptr[n], augmented.indptr[n + 1])
+    columns = np.arange(n)
+
+    # subsets in order of size, so both halves of every split are final
+    for S in sorted(range(1, full + 1), key=lambda mask: bin(mask).count("1")):
+        if S & (S - 1) == 0:
+            continue
+
+        A = _submasks(S)
+        merged = cost[A] + cost[S ^ A]
+        best = np.argmin(merged, axis=0)
+        cost[S] = merged[best, columns]
+        split[S] = A[best]
+
+        # grow: v is reached from the cheapest merge point through a shortest path
+        augmented.data[row] = cost[S]
+        grown, grown_pred = dijkstra(augmented, directed=True, indices=n, return_predecessors=True)
+        cost[S] = grown[:n]
+        pred[S] = np.where(grown_pred[:n] == n, NO_PREDECESSOR, grown_pred[:n])
+
+    root = position[terminals[-1]]
+    tree_nodes = set()
+    tree_edges = set()
+    stack = [(full, root)]
+    while stack:
+        S, v = stack.pop()
+        tree_nodes.add(v)
+        # walk the grow path back to where the subtree was merged (or to the terminal)
+        while pred[S][v] != NO_PREDECESSOR:
+            u = pred[S][v]
+            tree_edges.add((min(u, v), max(u, v)))
+            tree_nodes.add(u)
+            v = u
+        if S & (S - 1):
+            A = int(split[S][v])
+            stack.append((A, v))
+            stack.append((S ^ A, v))
+
+    tree_nodes = {nodes[i] for i in tree_nodes}
+    tree_edges = [(nodes[u], nodes[v], G[nodes[u]][nodes[v]].get(weight, 1)) for u, v in sorted(tree_edges)]
+    return tree_nodes, tree_edges, uncovered
@@ -1,15 +1,20 @@
 import networkx as nx
-import random
+from .dijkstra_steiner import grow_steiner_tree, grow_steiner_tree_cached
+from .mehlhorn_steiner import mehlhorn_steiner_tree
+from .exact_steiner import exact_steiner_tree
+from .spt_cache import resolve_spt_cache
+from .multi_start import make_rng, draw_starts, best_of_starts
+from .steiner_tree import check_oracle
 
-def steiner_tree(G, required_nodes, return_type='nodes'):
-    
-    if not required_nodes:
-        return set() if return_type == 'nodes' else nx.Graph()
-
-    # randomly select a starting node
-    tree_nodes = set()
-    current = random.choice(list(required_nodes))
-    tree_nodes.add(current)
+def pairwise_steiner_tree(G, required_nodes, current, oracle=None, cache=None):
+    # Original greedy: shortest path from every uncovered node to every tree node per step.
+    # With a distance oracle the pairs are ranked by oracle lookups and only the
+    # winning pair's path is materialized. With a shortest path tree cache the pairs
+    # are read from the trees of the uncovered nodes.
+    tree_nodes = {current}
+    if cache is not None and oracle is None:
+        # check G against the cached arrays once, the per-pair lookups only check identity
+        cache.graph_arrays(G)
 
     uncovered = set(required_nodes)
     uncovered.remove(current)
@@ -18,27 +23,101 @@ def steiner_tree(G, required_nodes, return_type='nodes'):
     while uncovered:
         best_path = None
         best_length = float('inf')
+        # ties go to the first pair in string order, independent of set iteration order
+        ordered_tree = sorted(tree_nodes, key=str)
+        ordered_uncovered = sorted(uncovered, key=str)
 
         # find the shortest path from any uncovered node to any node in the tree
-        for u in uncovered:
-            try:
-                for t in tree_nodes:
-                    path = nx.shortest_path(G, source=u, target=t, weight="weight")
-                    length = nx.path_weight(G, path, weight="weight")
+        if oracle is not None:
+            best_pair = None
+            for u in ordered_uncovered:
+                for t in ordered_tree:
+                    length = oracle.distance(u, t)
+                    if length < best_length:
+                        best_length = length
+                        best_pair = (u, t)
+            if best_pair is not None:
+                best_path = oracle.shortest_path(*best_pair)
+        elif cache is not None:
+            best_pair = None
+            for u in ordered_uncovered:
+                for t in ordered_tree:
+                    length = cache.distance(G, u, t)
                     if length < best_length:
                         best_length = length
-                        best_path = path
-            except nx.NetworkXNoPath:
-                continue
+                        best_pair = (u, t)
+            if best_pair is not None:
+                best_path = cache.path(G, *best_pair)
+        else:
+            for u in ordered_uncovered:
+                try:
+                    for t in ordered_tree:
+                        path = nx.shortest_path(G, source=u, target=t, weight="weight")
+                        length = nx.path_weight(G, path, weight="weight")
+                        if length < best_length:
+                            best_length = length
+                            best_path = path
+                except nx.NetworkXNoPath:
+                    continue
 
         if best_path is None:
-            print(f" Warning: Cannot connect to node(s): {uncovered}")
             break
 
         # add nodes in the best path to the tree
         tree_nodes.update(best_path)
         uncovered -= set(best_path)  # remove covered nodes
 
+    return tree_nodes, uncovered
+
+def steiner_tree(G, required_nodes, return_type='nodes', method='dijkstra', oracle=None, spt_cache=None,
+                 start=None, rng=None, seed=None, n_starts=1, workers=None):
+
+    if not required_nodes:
+        return set() if return_type == 'nodes' else nx.Graph()
+
+    # 'dijkstra': one multi-source Dijkstra per attached terminal
+    # 'pairwise': original per-pair shortest path search
+    # 'mehlhorn': deterministic Voronoi/MST 2-approximation
+    # 'exact': optimal tree by subset DP, 'dijkstra' above the exact terminal limit
+    # spt_cache: None uses the shared shortest path tree cache if enabled, False runs without one
+    # rng / seed: source of the random start terminal (default: the global RNG)
+    # n_starts: grow from that many start terminals and keep the cheapest tree
+    # oracle: distance oracle of G, used by 'dijkstra' and 'pairwise' only
+    check_oracle(method, oracle)
+    cache = resolve_spt_cache(spt_cache)
+    exact = None
+    if method == 'exact':
+        exact = exact_steiner_tree(G, required_nodes, cache=cache)
+        if exact is None:
+            method = 'dijkstra'
+
+    if exact is not None:
+        tree_nodes, tree_edges, uncovered = exact
+    elif method == 'mehlhorn':
+        tree_nodes, tree_edges, uncovered = mehlhorn_steiner_tree(G, required_nodes)
+    elif method in ('dijkstra', 'pairwise'):
+        # an oracle answering by table lookup ranks the (tree node, terminal) pairs itself,
+        # a search-based one (landmarks) would run one A* per pair: 'dijkstra' then keeps
+        # its multi-source growth
+        lookup_oracle = oracle if getattr(oracle, "lookup", False) else None
+
+        def grow(current):
+            if method == 'dijkstra' and lookup_oracle is None and cache is not None:
+                return grow_steiner_tree_cached(G, required_nodes, current, cache)
+            if method == 'dijkstra' and lookup_oracle is None:
+                return grow_steiner_tree(G, required_nodes, current)
+            tree_nodes, uncovered = pairwise_steiner_tree(G, required_nodes, current, oracle=oracle, cache=cache)
+            return tree_nodes, None, uncovered
+
+        # randomly select the starting node(s) (unless the caller already drew one)
+        starts = [start] if start is not None else draw_starts(required_nodes, make_rng(rng, seed), n_starts)
+        tree_nodes, _, uncovered = best_of_starts(G, starts, grow, workers=workers)
+    else:
+        raise ValueError("method must be 'dijkstra', 'pairwise', 'mehlhorn' or 'exact'")
+
+    if uncovered:
+        print(f" Warning: Cannot connect to node(s): {uncovered}")
+
     # return the result based on the return type
     if return_type == 'nodes':
         return tree_nodes
@@ -49,10 +128,14 @@ def steiner_tree(G, required_nodes, return_type='nodes'):
     else:
         raise ValueError("return_type must be 'nodes' or 'graph'")
 
-def steiner_tree_nodes(G, required_nodes):
+def steiner_tree_nodes(G, required_nodes, method='dijkstra', oracle=None, spt_cache=None, start=None,
+                       rng=None, seed=None, n_starts=1, workers=None):
     # Use the steiner_tree function to get nodes
-    return steiner_tree(G, required_nodes, return_type='nodes')
+    return steiner_tree(G, required_nodes, return_type='nodes', method=method, oracle=oracle, spt_cache=spt_cache,
+                        start=start, rng=rng, seed=seed, n_starts=n_starts, workers=workers)
 
-def steiner_tree_graph(G, required_nodes):
+def steiner_tree_graph(G, required_nodes, method='dijkstra', oracle=None, spt_cache=None, start=None,
+                       rng=None, seed=None, n_starts=1, workers=None):
     # Use the steiner_tree function to get the subgraph
-    return steiner_tree(G, required_nodes, return_type='graph')
\ No newline at end of file
+    return steiner_tree(G, required_nodes, return_type='graph', method=method, oracle=oracle, spt_cache=spt_cache,
+                        start=start, rng=rng, seed=seed, n_starts=n_starts, workers=workers)
@@ -1,41 +1,68 @@
+import numpy as np
 import networkx as nx
-from collections import defaultdict
 from .steiner_tree import steiner_tree_nodes
+from .skill_index import get_skill_index, popcount
+from .spt_cache import resolve_spt_cache
+from .team_scoring import team_cost
+from .component_index import get_component_index, task_authors
+from .shortest_paths import bounded_dijkstra
 
-def graph_aware_greedy_cover(G, author_skills, T, current_team=set()):
-    covered_skills = set()
+def shortest_distance(G, source, target, oracle=None, cache=None):
+    # shortest path length through the distance oracle when one is available,
+    # otherwise from the cached shortest path tree of target (the team center)
+    if oracle is not None:
+        return oracle.distance(source, target)
+    if cache is not None:
+        return cache.distance(G, target, source)
+    try:
+        return nx.shortest_path_length(G, source=source, target=target, weight='weight')
+    except nx.NetworkXNoPath:
+        return float('inf')
+
+def graph_aware_greedy_cover_scan(G, author_skills, T, current_team=set(), oracle=None, index=None, spt_cache=None,
+                                  authors=None):
+    # Reference version: rescans every candidate with one distance lookup each per round.
+    # authors: only these authors may be chosen (e.g. one connected component)
+    index = index or get_skill_index(author_skills)
+    # spt_cache: None uses the shared shortest path tree cache if enabled, False runs without one
+    cache = resolve_spt_cache(spt_cache)
+    if cache is not None:
+        # check G against the cached arrays once, the per-center lookups only check identity
+        cache.graph_arrays(G)
+    target = index.mask(T)
+    covered = 0
     team = set(current_team)
+
+    # only authors holding at least one needed skill can ever be chosen
+    candidates = [author for author in index.candidates(T) if authors is None or author in authors]
     
     # compute center of the current team
     center = None
     if team:
-        center = min(team, key=lambda a: sum(
-            nx.shortest_path_length(G, source=a, target=b, weight='weight') 
+        center = min(sorted(team, key=str), key=lambda a: sum(
+            shortest_distance(G, a, b, oracle, cache)
             for b in team
         ))
     
-    while covered_skills != T:
+    while covered != target:
         best_author = None
         best_score = -float('inf')
         
-        for author, skills in author_skills.items():
+        for author in candidates:
             if author in team:
                 continue
                 
-            new_skills = (skills & T) - covered_skills
+            new_skills = index.author_masks[author] & target & ~covered
             if not new_skills:
                 continue
                 
             # compute connection cost to the center
             connection_cost = 0
             if center:
-                try:
-                    connection_cost = nx.shortest_path_length(G, source=author, target=center, weight='weight')
-                except nx.NetworkXNoPath:
-                    connection_cost = float('inf')
+                connection_cost = shortest_distance(G, author, center, oracle, cache)
             
             # total score is a combination of new skills and connection cost
-            coverage_score = len(new_skills)
+            coverage_score = popcount(new_skills)
             connection_score = 1 / (connection_cost + 1)  # avoid division by zero
             total_score = coverage_score * connection_score
             
@@ -48,29 +75,124 @@ def graph_aware_greedy_cover(G, author_skills, T, current_team=set()):
             break
             
         team.add(best_author)
-        covered_skills |= best_new_skills
+        covered |= best_new_skills
         # update center to the newly added author
         center = best_author
     
     return team
 
-def graph_aware_cover_steiner(G, author_skills, T):
+def center_distances(G, center, candidates, oracle=None, cache=None, gains=None):
+    # distances from every candidate to the center, the same values shortest_distance gives.
+    # Without a lookup oracle or a cache, candidates that cannot outscore the nearest one
+    # (given their gains) are left at inf.
+    # A search-based oracle (landmarks) would run one A* per candidate, the searches from
+    # the center below answer all of them at once.
+    if getattr(oracle, "lookup", False):
+        return np.array([oracle.distance(author, center) for author in candidates], dtype=np.float64)
+    if cache is not None:
+        _, index, _ = cache.graph_arrays(G, validate=False)
+        if center not in index:
+            return np.full(len(candidates), np.inf)
+        dist, _ = cache.tree(G, center)
+        positions = np.array([index.get(author, -1) for author in candidates], dtype=np.int64)
+        return np.where(positions >= 0, dist[positions], np.inf)
+    # Bounded searches from the center (path sums may differ from the reverse direction in
+    # the last bit). The nearest candidate c scores gains(c) / (d(c) + 1), a candidate
+    # farther than max(gains) * (d(c) + 1) / gains(c) - 1 scores less and is not searched for.
+    targets = set(candidates)
+    cutoff = None
+    if gains is not None:
+        dist, _, reached = bounded_dijkstra(G, [center], targets=targets, stop_after=1)
+        if not reached:
+            return np.full(len(candidates), np.inf)
+        nearest = reached[0]
+        gain = gains[candidates.index(nearest)]
+        cutoff = (gains.max() * (dist[nearest] + 1) / gain - 1) * (1 + 1e-9)
+    lengths, _, _ = bounded_dijkstra(G, [center], targets=targets, cutoff=cutoff)
+    return np.array([lengths.get(author, np.inf) for author in candidates], dtype=np.float64)
+
+def graph_aware_greedy_cover(G, author_skills, T, current_team=set(), oracle=None, index=None, spt_cache=None,
+                             authors=None):
+    # Same choices as graph_aware_greedy_cover_scan, vectorized: the needed skills of the
+    # candidates form a boolean matrix, every round takes one distance array from the new
+    # center (its cached shortest path tree) and scores all candidates at once. Candidates
+    # with nothing left to add are dropped, the rest keep their order, so argmax breaks
+    # ties like the scan.
+    # authors: only these authors may be chosen (e.g. one connected component)
+    index = index or get_skill_index(author_skills)
+    # spt_cache: None uses the shared shortest path tree cache if enabled, False runs without one
+    cache = resolve_spt_cache(spt_cache)
+    if cache is not None:
+        # check G against the cached arrays once, the per-center lookups only check identity
+        cache.graph_arrays(G)
+    target = index.mask(T)
+    team = set(current_team)
+
+    # only authors holding at least one needed skill can ever be chosen
+    candidates = [author for author in index.candidates(T)
+                  if (authors is None or author in authors) and author not in team]
+    bits = [bit for bit in range(target.bit_length()) if target >> bit & 1]
+    holds = np.array([[index.author_masks[author] >> bit & 1 for bit in bits] for author in candidates],
+                     dtype=bool).reshape(len(candidates), len(bits))
+    needed = np.ones(len(bits), dtype=bool)
+
+    # compute center of the current team
+    center = None
+    if team:
+        center = min(sorted(team, key=str), key=lambda a: sum(
+            shortest_distance(G, a, b, oracle, cache)
+            for b in team
+        ))
+
+    while needed.any():
+        gains = holds[:, needed].sum(axis=1)
+
+        # drop candidates that add nothing anymore
+        useful = gains > 0
+        if not useful.any():
+            break
+        if not useful.all():
+            candidates = [author for author, keep in zip(candidates, useful) if keep]
+            holds, gains = holds[useful], gains[useful]
+
+        # total score is a combination of new skills and connection cost
+        if center:
+            scores = gains * (1 / (center_distances(G, center, candidates, oracle, cache, gains) + 1))
+        else:
+            scores = gains * 1.0
+        best = int(np.argmax(scores))
+
+        best_author = candidates[best]
+        team.add(best_author)
+        needed &= ~holds[best]
+        # update center to the newly added author
+        center = best_author
+
+        del candidates[best]
+        holds = np.delete(holds, best, axis=0)
+
+    return team
+
+def graph_aware_cover_steiner(G, author_skills, T, method='dijkstra', oracle=None, spt_cache=None, rng=None,
+                              seed=None, n_starts=1, reduce=False, components=None):
+    # components: None uses the shared component index, False skips the check
+
+    # Fail fast when no connected component can cover T, otherwise cover inside one
+    components = get_component_index(G, author_skills) if components is None else components or None
+    authors = task_authors(components, T)
+    if authors is not None and not authors:
+        return set(), 0, False
 
     # Greedy cover
-    X0 = graph_aware_greedy_cover(G, author_skills, T)
+    X0 = graph_aware_greedy_cover(G, author_skills, T, oracle=oracle, spt_cache=spt_cache, authors=authors)
     
     # SteinerTree
-    team = steiner_tree_nodes(G, X0) 
+    team = steiner_tree_nodes(G, X0, method=method, oracle=oracle, spt_cache=spt_cache, rng=rng, seed=seed,
+                              n_starts=n_starts, reduce=reduce)
     
 
-    subgraph = G.subgraph(team)
-    is_connected = nx.is_connected(subgraph)
-    mst_cost = 0
-    
-    if is_connected:
-        mst = nx.minimum_spanning_tree(subgraph)
-        mst_cost = sum(data['weight'] for _, _, data in mst.edges(data=True))
-    else:
+    mst_cost, is_connected = team_cost(G, team)
+    if not is_connected:
         print("Team members are not connected, unable to compute mst cost")
     
     return team, mst_cost, is_connected
\ No newline at end of file
@@ -1,45 +1,89 @@
 from collections import defaultdict
 import networkx as nx
 from .fast_steiner_tree import steiner_tree_graph
-
-def enhance_graph_with_cliques(G, author_skills, T, D=1e9):
-    H = nx.Graph()
+from .skill_index import get_skill_index
+from .team_scoring import team_cost
+from .component_index import get_component_index, task_authors
+
+def build_author_gadgets(G, author_skills, construction='clique'):
+    # Task-independent pieces of H for every author in G: its author::skill nodes and the
+    # node representing the author. Returns (gadgets, author_skill_map),
+    # gadgets: author -> ({skill: author::skill node}, representative).
+    # construction='clique': every pair of an author's skill nodes is joined (weight 0),
+    #                        the first skill node represents the author
+    # construction='star':   every skill node gets a zero-weight spoke to a hub node,
+    #                        the hub represents the author
+    # Both keep all of an author's nodes at distance 0 from each other, so Steiner
+    # tree costs are the same while the star needs k instead of k(k-1)/2 edges.
+    if construction not in ('clique', 'star'):
+        raise ValueError("construction must be 'clique' or 'star'")
+
+    gadgets = {}
     author_skill_map = dict()
-    skill_nodes = set()
-    clique_nodes_map = dict()      # author → [author::skill, ...]
-    representative_node_map = {}   # author → representative node
 
     # Create author representative nodes (split by skill)
     for author, skills in author_skills.items():
         if author not in G:
             continue
 
-        clique_nodes = [f"{author}::{skill}" for skill in skills]
-        clique_nodes_map[author] = clique_nodes
-
-        for node in clique_nodes:
-            H.add_node(node)
+        # sorted, so the representative and the node order do not depend on string hashing
+        skill_nodes = {skill: f"{author}::{skill}" for skill in sorted(skills)}
+        for node in skill_nodes.values():
             author_skill_map[node] = author
 
-        # internal clique connections
-        for i in range(len(clique_nodes)):
-            for j in range(i + 1, len(clique_nodes)):
-                H.add_edge(clique_nodes[i], clique_nodes[j], weight=0)
-
-        # choose a representative node for the author
-        if clique_nodes:
-            representative_node_map[author] = clique_nodes[0]
+        if not skill_nodes:
+            gadgets[author] = (skill_nodes, None)
+        elif construction == 'clique':
+            gadgets[author] = (skill_nodes, next(iter(skill_nodes.values())))
+        else:
+            hub = f"hub::{author}"
+            author_skill_map[hub] = author
+            gadgets[author] = (skill_nodes, hub)
+
+    return gadgets, author_skill_map
+
+def gadget_edges(nodes, representative, construction='clique'):
+    # zero-weight edges joining an author's nodes: internal clique or hub spokes
+    if construction == 'clique':
+        return [(nodes[i], nodes[j]) for i in range(len(nodes)) for j in range(i + 1, len(nodes))]
+    return [(representative, node) for node in nodes]
+
+def assemble_enhanced_graph(G, gadgets, authors, construction='clique', position=None, skills=None):
+    # H over the given authors: their gadgets plus the sparse representative edges of the
+    # collaborations among them, added in G.edges() order.
+    # skills: keep only the skill nodes of these skills (and the representative). The
+    # others hang off their gadget at distance 0 and are never terminals, so Steiner
+    # costs do not change while a clique shrinks from k(k-1)/2 to about |T|^2 / 2 edges.
+    position = position or {node: i for i, node in enumerate(G)}
+    H = nx.Graph()
+    for author in authors:
+        skill_nodes, representative = gadgets[author]
+        nodes = [node for skill, node in skill_nodes.items()
+                 if skills is None or skill in skills or node == representative]
+        H.add_nodes_from(nodes)
+        H.add_edges_from(gadget_edges(nodes, representative, construction), weight=0)
 
     # construct sparse connections between representative nodes
-    for u, v, data in G.edges(data=True):
-        if u in representative_node_map and v in representative_node_map:
-            rep_u = representative_node_map[u]
-            rep_v = representative_node_map[v]
-            weight = data.get("weight", 1.0)
-            H.add_edge(rep_u, rep_v, weight=weight)
-
-    # Add virtual skill nodes and connections 
-    for skill in T:
+    members = {author for author in authors if gadgets[author][1] is not None}
+    for u in sorted(members, key=position.get):
+        for v, data in G[u].items():
+            if v in members and position[v] >= position[u]:
+                H.add_edge(gadgets[u][1], gadgets[v][1], weight=data.get("weight", 1.0))
+    return H
+
+def build_base_enhanced_graph(G, author_skills, construction='clique'):
+    # Task-independent part of H for every author in author_skills: the author::skill nodes
+    # with their zero-weight gadget and the sparse representative edges. Only the skill::
+    # terminals depend on T.
+    gadgets, author_skill_map = build_author_gadgets(G, author_skills, construction)
+    H = assemble_enhanced_graph(G, gadgets, list(gadgets), construction)
+    clique_nodes_map = {author: list(skill_nodes.values()) for author, (skill_nodes, _) in gadgets.items()}  # author → [author::skill, ...]
+    return H, author_skill_map, clique_nodes_map
+
+def add_skill_terminals(H, author_skills, T, D=1e9):
+    # Add virtual skill nodes and connections, returns the set of skill nodes
+    skill_nodes = set()
+    for skill in sorted(T):
         skill_node = f"skill::{skill}"
         H.add_node(skill_node)
         skill_nodes.add(skill_node)
@@ -51,23 +95,36 @@ def enhance_graph_with_cliques(G, author_skills, T, D=1e9):
                 if skill_specific_node in H:
                     H.add_edge(skill_node, skill_specific_node, weight=D)
 
-    return H, skill_nodes, author_skill_map
-
-def improved_enhance_steiner(G, author_skills, T):
-    # Filter relevant authors (at least one target skill)
-    relevant_authors = {
-        author: skills for author, skills in author_skills.items() 
-        if skills & T and author in G  # ensure author exists in the graph
-    }
-    
-    if not relevant_authors:
-        return set(), 0, False
-
-    # Create enhanced graph H
-    H, skill_nodes, author_skill_map = enhance_graph_with_cliques(G, relevant_authors, T)
+    return skill_nodes
 
-    
+def enhance_graph_with_cliques(G, author_skills, T, D=1e9, construction='clique'):
+    # Standalone per-task construction of the enhanced graph H
+    H, author_skill_map, _ = build_base_enhanced_graph(G, author_skills, construction)
+    skill_nodes = add_skill_terminals(H, author_skills, T, D)
+    return H, skill_nodes, author_skill_map
 
+# author gadgets per (G, author_skills) pair, reused by every query on that dataset
+_gadget_cache = {}
+
+def get_author_gadgets(G, author_skills, construction='clique'):
+    # (gadgets, author_skill_map, position of every node in G)
+    # the gadgets only depend on the nodes of G, its edges are read per query by
+    # assemble_enhanced_graph, so the fingerprint skips the O(E) edge count
+    key = (id(G), id(author_skills), construction)
+    fingerprint = (G.number_of_nodes(), len(author_skills))
+    cached = _gadget_cache.get(key)
+    if cached is not None and cached[0] is G and cached[1] is author_skills and cached[2] == fingerprint:
+        return cached[3]
+
+    if len(_gadget_cache) >= 4:
+        _gadget_cache.clear()
+    gadgets, author_skill_map = build_author_gadgets(G, author_skills, construction)
+    parts = (gadgets, author_skill_map, {node: i for i, node in enumerate(G)})
+    _gadget_cache[key] = (G, author_skills, fingerprint, parts)
+    return parts
+
+def _steiner_on_enhanced_graph(H, skill_nodes, method, rng=None, seed=None, n_starts=1):
+    # Steiner tree over the connected skill terminals, None when nothing can be connected
     # check skill nodes connectivity
     connected_skill_nodes = set()
     for skill_node in skill_nodes:
@@ -75,7 +132,7 @@ def improved_enhance_steiner(G, author_skills, T):
             connected_skill_nodes.add(skill_node)
 
     if not connected_skill_nodes:
-        return set(), 0, False
+        return None
 
     disconnected_skills = skill_nodes - connected_skill_nodes
     if disconnected_skills:
@@ -83,11 +140,44 @@ def improved_enhance_steiner(G, author_skills, T):
 
     # Use Steiner Tree to cover connected skill nodes
     try:
-        steiner_tree_subgraph = steiner_tree_graph(H, connected_skill_nodes)  
-        steiner_nodes = set(steiner_tree_subgraph.nodes())
+        # the terminal overlay changes with every task, trees over H would never be reused
+        steiner_tree_subgraph = steiner_tree_graph(H, connected_skill_nodes, method=method, spt_cache=False,
+                                                   rng=rng, seed=seed, n_starts=n_starts)
+        return set(steiner_tree_subgraph.nodes())
         
     except Exception as e:
         print(f"Steiner Tree failed: {e}")
+        return None
+
+def improved_enhance_steiner(G, author_skills, T, method='dijkstra', construction='clique', rng=None, seed=None,
+                             n_starts=1, components=None):
+    # components: None uses the shared component index, False skips the check
+
+    # Fail fast when no connected component can cover T, otherwise drop the authors of
+    # components that cannot (the Steiner search picks among the others itself)
+    components = get_component_index(G, author_skills) if components is None else components or None
+    authors = task_authors(components, T, single=False)
+    if authors is not None and not authors:
+        return set(), 0, False
+
+    # Filter relevant authors (at least one target skill) through the skill posting lists
+    relevant_authors = {
+        author: author_skills[author] for author in get_skill_index(author_skills).candidates(T)
+        if author in G  # ensure author exists in the graph
+        and (authors is None or author in authors)
+    }
+    
+    if not relevant_authors:
+        return set(), 0, False
+
+    # Enhanced graph H: a small graph over the relevant authors and their skill nodes of T,
+    # assembled from the cached author gadgets, plus this task's skill terminals
+    gadgets, author_skill_map, position = get_author_gadgets(G, author_skills, construction)
+    H = assemble_enhanced_graph(G, gadgets, relevant_authors, construction, position, skills=T)
+    skill_nodes = add_skill_terminals(H, relevant_authors, T)
+    steiner_nodes = _steiner_on_enhanced_graph(H, skill_nodes, method, rng=rng, seed=seed, n_starts=n_starts)
+
+    if steiner_nodes is None:
         return set(), 0, False
 
     # Backtrack to find real authors
@@ -97,13 +187,6 @@ def improved_enhance_steiner(G, author_skills, T):
     if not team:
         return set(), 0, False
         
-    subgraph = G.subgraph(team)
-    is_connected = nx.is_connected(subgraph) if len(team) > 1 else True
-    mst_cost = 0
-
-    if is_connected and len(team) > 1:
-        mst = nx.minimum_spanning_tree(subgraph, weight='weight')
-        mst_cost = sum(data.get('weight', 1.0) for _, _, data in mst.edges(data=True))
-    
+    mst_cost, is_connected = team_cost(G, team)
 
-    return team, mst_cost, is_connected
\ No newline at end of file
+    return team, mst_cost, is_connected
@@ -0,0 +1,98 @@
+from .shortest_paths import voronoi_regions, backtrack_path
+
+def _find(parent, x):
+    # union-find root lookup with path halving
+    while parent[x] != x:
+        parent[x] = parent[parent[x]]
+        x = parent[x]
+    return x
+
+def mehlhorn_steiner_tree(G, required_nodes, weight="weight"):
+    # Mehlhorn's 2-approximation: Voronoi regions of the terminals, a reduced
+    # terminal graph from the region boundary edges, its MST, and every MST edge
+    # expanded back into the shortest path it stands for.
+    # sorted so the result does not depend on set iteration order
+    terminals = sorted((node for node in required_nodes if node in G), key=str)
+    if not terminals:
+        return set(), [], set(required_nodes)
+
+    dist, pred, origin = voronoi_regions(G, terminals, weight=weight)
+
+    # cheapest boundary edge between every pair of neighbouring regions
+    bridges = {}  # {s, t} -> (cost, u, v, edge weight)
+    for u, v, data in G.edges(data=True):
+        if u not in origin or v not in origin:
+            continue
+        s, t = origin[u], origin[v]
+        if s == t:
+            continue
+        w = data.get(weight, 1)
+        cost = dist[u] + w + dist[v]
+        key = frozenset((s, t))
+        if key not in bridges or cost < bridges[key][0]:
+            bridges[key] = (cost, u, v, w)
+
+    # Kruskal on the reduced terminal graph (ties broken by discovery order)
+    parent = {terminal: terminal for terminal in terminals}
+    mst_bridges = []
+    for _, (cost, u, v, w) in sorted(enumerate(bridges.values()), key=lambda item: (item[1][0], item[0])):
+        root_s, root_t = _find(parent, origin[u]), _find(parent, origin[v])
+        if root_s != root_t:
+            parent[root_s] = root_t
+            mst_bridges.append((u, v, w))
+
+    # keep the largest group of terminals that could be connected
+    groups = {}
+    for terminal in terminals:
+        groups.setdefault(_find(parent, terminal), []).append(terminal)
+    root = max(groups, key=lambda r: len(groups[r]))
+    connected = set(groups[root])
+
+    # expand: region shortest paths from both endpoints plus the boundary edge
+    tree_nodes = set(connected)
+    for u, v, _ in mst_bridges:
+        if origin[u] in connected:
+            tree_nodes.update(backtrack_path(pred, u))
+            tree_nodes.update(backtrack_path(pred, v))
+
+    tree_nodes, tree_edges = _prune_spanning_tree(G, tree_nodes, connected, weight)
+
+    uncovered = set(required_nodes) - connected
+    return tree_nodes, tree_edges, uncovered
+
+def _prune_spanning_tree(G, nodes, terminals, weight):
+    # Final KMB steps: MST of the subgraph induced by the expanded paths, then
+    # repeatedly drop leaves that are not terminals. Equal weights are broken by the
+    # string order of the endpoints, not by set iteration order.
+    nodes = sorted(nodes, key=str)
+    parent = {node: node for node in nodes}
+    inside = set(nodes)
+    edges = sorted(
+        ((data.get(weight, 1), str(u), str(v), u, v) for u in nodes for v, data in G[u].items()
+         if v in inside and str(u) < str(v)),
+        key=lambda item: item[:3],
+    )
+    adjacency = {node: {} for node in nodes}
+    for w, _, _, u, v in edges:
+        root_u, root_v = _find(parent, u), _find(parent, v)
+        if root_u != root_v:
+            parent[root_u] = root_v
+            adjacency[u][v] = w
+            adjacency[v][u] = w
+
+    leaves = [node for node, nbrs in adjacency.items() if len(nbrs) <= 1 and node not in terminals]
+    while leaves:
+        leaf = leaves.pop()
+        if leaf not in adjacency:
+            continue
+        for nbr in adjacency.pop(leaf):
+            del adjacency[nbr][leaf]
+            if len(adjacency[nbr]) <= 1 and nbr not in terminals:
+                leaves.append(nbr)
+
+    tree_edges = []
+    visited = set()
+    for u, nbrs in adjacency.items():
+        visited.add(u)
+        tree_edges.extend((u, v, w) for v, w in nbrs.items() if v not in visited)
+    return set(adjacency), tree_edges
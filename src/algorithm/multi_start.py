@@ -0,0 +1,67 @@
+import random
+import multiprocessing
+from .team_scoring import team_cost
+
+# Start terminal selection for the greedy Steiner growth.
+# Without rng/seed the global random module is used as before. With an explicit rng or
+# seed the terminals are drawn from their sorted order, so a seeded run returns the same
+# tree in every process (set order of string nodes depends on hash randomization).
+# n_starts > 1 grows one tree per distinct start and keeps the cheapest. The growth is
+# pure Python, so threads would not overlap: the starts run one after another in the
+# calling process (sharing its shortest path tree cache), or with workers > 1 in a
+# forked process pool that inherits the graph and the cache.
+
+def make_rng(rng=None, seed=None):
+    # explicit rng first, then a fresh Random(seed), else the global RNG
+    if rng is not None:
+        return rng
+    if seed is not None:
+        return random.Random(seed)
+    return random
+
+def draw_starts(required_nodes, rng=random, n_starts=1):
+    # n_starts distinct start terminals (all of them if there are fewer). The first one
+    # is the single-start draw, so best-of-k is never worse than one start.
+    if rng is random:
+        candidates = list(required_nodes)
+    else:
+        candidates = sorted(required_nodes, key=str)
+    first = rng.choice(candidates)
+    if n_starts <= 1:
+        return [first]
+    rest = [node for node in candidates if node != first]
+    return [first] + rng.sample(rest, min(n_starts - 1, len(rest)))
+
+# grow function of the current best_of_starts call, inherited by the forked workers
+_grow = None
+
+def _grow_start(start):
+    return _grow(start)
+
+def best_of_starts(G, starts, grow, workers=None):
+    # Run grow(start) -> (tree_nodes, tree_edges, uncovered) for every start and keep the
+    # tree that connects the most terminals at the lowest MST cost, ties go to the
+    # earliest start. workers > 1 runs the starts in that many forked processes (where
+    # fork is available and the caller is not a pool worker itself), trees computed there
+    # do not reach the caller's cache.
+    global _grow
+    if len(starts) == 1:
+        return grow(starts[0])
+
+    workers = min(workers or 1, len(starts))
+    can_fork = "fork" in multiprocessing.get_all_start_methods() and not multiprocessing.current_process().daemon
+    if workers > 1 and can_fork:
+        _grow = grow
+        try:
+            with multiprocessing.get_context("fork").Pool(processes=workers) as pool:
+                results = pool.map(_grow_start, starts)
+        finally:
+            _grow = None
+    else:
+        results = [grow(start) for start in starts]
+
+    def rank(i):
+        tree_nodes, _, uncovered = results[i]
+        return len(uncovered), team_cost(G, tree_nodes)[0], i
+
+    return results[min(range(len(results)), key=rank)]
@@ -0,0 +1,161 @@
+from collections import deque
+import networkx as nx
+from .mehlhorn_steiner import _prune_spanning_tree
+
+# Classic Steiner reductions of the collaboration graph.
+# Query independent (built once per graph, see get_reduction):
+#   - pendant trees: non-terminal leaves are peeled repeatedly, every peeled author
+#     remembers the neighbour it hung from
+#   - degree-2 chains: paths of degree-2 authors between two other authors are
+#     contracted into one edge weighing the whole path (parallel edges keep the cheapest)
+#   - component labels
+# The result is the kernel K. Per task (GraphReduction.instance):
+#   - K itself when every terminal is a kernel node (components without a terminal are
+#     never reached from the terminals, so they need not be cut away)
+#   - otherwise a copy of the components holding a terminal, with the pendant paths and
+#     chains that hold a terminal put back
+# A tree found on the instance is expanded back to original authors (expand).
+
+class GraphReduction:
+
+    def __init__(self, G, weight="weight"):
+        self.weight = weight
+        self.component = {}     # node -> component id
+        self.hang = {}          # peeled node -> (neighbour it hung from, edge weight)
+        self.chain_of = {}      # degree-2 node -> chain id
+        self.chains = []        # chain id -> node path [a, ..., b]
+        self.contracted = {}    # kernel edge (a, b) -> chain id it stands for
+
+        for label, nodes in enumerate(nx.connected_components(G)):
+            for node in nodes:
+                self.component[node] = label
+
+        # peel leaves until only the 2-core (or one root per tree component) is left
+        degree = dict(G.degree())
+        leaves = deque(node for node, d in degree.items() if d == 1)
+        peeled = set()
+        while leaves:
+            leaf = leaves.popleft()
+            if degree[leaf] != 1:
+                continue
+            for nbr, data in G[leaf].items():
+                if nbr not in peeled:
+                    break
+            peeled.add(leaf)
+            degree[leaf] = 0
+            self.hang[leaf] = (nbr, data.get(weight, 1))
+            degree[nbr] -= 1
+            if degree[nbr] == 1:
+                leaves.append(nbr)
+
+        def core_neighbours(node):
+            return [(nbr, data.get(weight, 1)) for nbr, data in G[node].items() if nbr not in peeled]
+
+        # contract maximal degree-2 paths between anchors (core degree != 2)
+        K = nx.Graph()
+        K.add_nodes_from(node for node in G if node not in peeled and degree[node] != 2)
+        for a in list(K.nodes()):
+            for nbr, w in core_neighbours(a):
+                path, total, prev = [a, nbr], w, a
+                while nbr not in K:
+                    step = [(n, nw) for n, nw in core_neighbours(nbr) if n != prev]
+                    prev, (nbr, nw) = nbr, step[0]
+                    path.append(nbr)
+                    total += nw
+                b = nbr
+                if len(path) == 2:
+                    self._add_edge(K, a, b, total, None)
+                elif str(a) <= str(b) and path[1] not in self.chain_of:
+                    # every chain is walked from both ends, keep one
+                    chain_id = len(self.chains)
+                    self.chains.append(path)
+                    for node in path[1:-1]:
+                        self.chain_of[node] = chain_id
+                    if a != b:
+                        self._add_edge(K, a, b, total, chain_id)
+
+        # cycles without any anchor stay as they are
+        for node in G:
+            if node not in peeled and degree[node] == 2 and node not in self.chain_of:
+                for nbr, w in core_neighbours(node):
+                    K.add_edge(node, nbr, **{weight: w})
+
+        self.kernel = K
+        self.kernel_nodes = {}  # component id -> kernel nodes
+        for node in K:
+            self.kernel_nodes.setdefault(self.component[node], []).append(node)
+
+    def _add_edge(self, K, a, b, w, chain_id):
+        # parallel edges: the cheapest one stays, contracted only records chain edges
+        if K.has_edge(a, b) and K[a][b][self.weight] <= w:
+            return
+        K.add_edge(a, b, **{self.weight: w})
+        if chain_id is None:
+            self.contracted.pop((a, b), None)
+            self.contracted.pop((b, a), None)
+        else:
+            self.contracted[(a, b)] = chain_id
+            self.contracted[(b, a)] = chain_id
+
+    def _add_chain(self, H, G, chain_id):
+        path = self.chains[chain_id]
+        for u, v in zip(path, path[1:]):
+            H.add_edge(u, v, **{self.weight: G[u][v].get(self.weight, 1)})
+
+    def instance(self, G, required_nodes):
+        # Reduced graph for one terminal set: kernel components holding a terminal plus
+        # the pendant paths and chains that hold a terminal. The kernel itself is returned
+        # (not copied) when no pendant path or chain has to be put back.
+        terminals = sorted((node for node in required_nodes if node in self.component), key=str)
+        if all(node in self.kernel for node in terminals):
+            return self.kernel
+        components = {self.component[node] for node in terminals}
+
+        nodes = [node for label in components for node in self.kernel_nodes[label]]
+        H = nx.Graph()
+        H.add_nodes_from(nodes)
+        H.add_edges_from(self.kernel.edges(nodes, data=True))
+
+        for node in terminals:
+            if node in H:
+                continue
+            # climb the pendant tree until the path reaches the instance
+            while node in self.hang:
+                parent, w = self.hang[node]
+                attached = parent in H
+                H.add_edge(node, parent, **{self.weight: w})
+                if attached:
+                    break
+                node = parent
+            else:
+                self._add_chain(H, G, self.chain_of[node])
+        return H
+
+    def expand(self, G, tree_nodes, tree_edges, required_nodes):
+        # Map a tree found on an instance back to G: contracted edges become their chains,
+        # then the KMB clean-up (MST + non-terminal leaf pruning) removes any cycle
+        # between a contracted edge and its own expanded chain.
+        nodes = set(tree_nodes)
+        for u, v, _ in tree_edges:
+            chain_id = self.contracted.get((u, v))
+            if chain_id is not None:
+                nodes.update(self.chains[chain_id])
+        if len(nodes) == 1:
+            return nodes, []
+        return _prune_spanning_tree(G, nodes, set(required_nodes) & nodes, self.weight)
+
+# reductions per graph, reused by every query on that dataset
+_reduction_cache = {}
+
+def get_reduction(G):
+    key = id(G)
+    fingerprint = (G.number_of_nodes(), G.number_of_edges())
+    cached = _reduction_cache.get(key)
+    if cached is not None and cached[0] is G and cached[1] == fingerprint:
+        return cached[2]
+
+    if len(_reduction_cache) >= 4:
+        _reduction_cache.clear()
+    reduction = GraphReduction(G)
+    _reduction_cache[key] = (G, fingerprint, reduction)
+    return reduction
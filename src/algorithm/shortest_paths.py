@@ -0,0 +1,109 @@
+import heapq
+import itertools
+
+def bounded_dijkstra(G, sources, targets=None, cutoff=None, max_settled=None, stop_after=None, weight="weight"):
+    # Multi-source Dijkstra (every source starts at distance 0) that stops as soon as
+    #   - every target is settled (or the first stop_after of them),
+    #   - the next node lies farther than cutoff, or
+    #   - max_settled nodes are settled.
+    # Returns (dist, pred, reached): the settled part of the distance and predecessor
+    # maps and the settled targets in order of distance. A node missing from dist is
+    # farther than the search went, not necessarily unreachable.
+    dist = {}
+    pred = {}
+    seen = {}
+    heap = []
+    reached = []
+    counter = itertools.count()  # FIFO tie-breaking between equal distances
+
+    if targets is not None:
+        targets = targets if isinstance(targets, (set, frozenset, dict)) else set(targets)
+        wanted = len(targets) if stop_after is None else min(stop_after, len(targets))
+        if wanted == 0:
+            return dist, pred, reached
+
+    for source in sources:
+        if source in G and source not in seen:
+            seen[source] = 0
+            pred[source] = None
+            heapq.heappush(heap, (0, next(counter), source))
+
+    while heap:
+        d, _, u = heapq.heappop(heap)
+        if u in dist:
+            continue
+        if cutoff is not None and d > cutoff:
+            break
+        dist[u] = d
+
+        if targets is not None and u in targets:
+            reached.append(u)
+            if len(reached) == wanted:
+                break
+        if max_settled is not None and len(dist) >= max_settled:
+            break
+
+        for v, data in G[u].items():
+            if v in dist:
+                continue
+            vd = d + data.get(weight, 1)
+            if cutoff is not None and vd > cutoff:
+                continue
+            if v not in seen or vd < seen[v]:
+                seen[v] = vd
+                pred[v] = u
+                heapq.heappush(heap, (vd, next(counter), v))
+
+    return dist, pred, reached
+
+def multi_source_dijkstra(G, sources, targets=None, weight="weight"):
+    # Run one Dijkstra from all sources at once (every source starts at distance 0).
+    # If targets is given, stop as soon as the first target is settled.
+    # Returns (dist, pred, reached): settled distances, predecessor map and the
+    # settled target (None if no target was reached).
+    dist, pred, reached = bounded_dijkstra(G, sources, targets, stop_after=1, weight=weight)
+    return dist, pred, reached[0] if reached else None
+
+def backtrack_path(pred, node):
+    # Follow the predecessor map from node back to its source, returns source -> node path
+    path = [node]
+    while pred[node] is not None:
+        node = pred[node]
+        path.append(node)
+    path.reverse()
+    return path
+
+def voronoi_regions(G, terminals, weight="weight"):
+    # Multi-source Dijkstra that also records which terminal each node is closest to.
+    # Returns (dist, pred, origin), origin[v] is the terminal whose region v belongs to.
+    dist = {}
+    pred = {}
+    origin = {}
+    seen = {}
+    heap = []
+    counter = itertools.count()
+
+    for terminal in terminals:
+        if terminal in G and terminal not in seen:
+            seen[terminal] = 0
+            pred[terminal] = None
+            origin[terminal] = terminal
+            heapq.heappush(heap, (0, next(counter), terminal))
+
+    while heap:
+        d, _, u = heapq.heappop(heap)
+        if u in dist:
+            continue
+        dist[u] = d
+
+        for v, data in G[u].items():
+            if v in dist:
+                continue
+            vd = d + data.get(weight, 1)
+            if v not in seen or vd < seen[v]:
+                seen[v] = vd
+                pred[v] = u
+                origin[v] = origin[u]
+                heapq.heappush(heap, (vd, next(counter), v))
+
+    return dist, pred, origin
@@ -0,0 +1,68 @@
+from collections import defaultdict
+
+def popcount(mask):
+    # number of skills in a bitmask
+    return bin(mask).count("1")
+
+class SkillIndex:
+    # Integer skill ids, one bitmask per author and skill -> authors posting lists.
+    # Posting lists keep the iteration order of author_skills so greedy tie-breaking
+    # matches a plain scan over author_skills.
+
+    def __init__(self, author_skills):
+        self.skill_ids = {}                 # skill -> bit position
+        self.skills = []                    # bit position -> skill
+        self.author_order = {}              # author -> position in author_skills
+        self.author_masks = {}              # author -> bitmask of skills
+        self.postings = defaultdict(list)   # skill id -> authors holding it
+
+        for position, (author, skills) in enumerate(author_skills.items()):
+            self.author_order[author] = position
+            mask = 0
+            for skill in skills:
+                skill_id = self.skill_ids.get(skill)
+                if skill_id is None:
+                    skill_id = self.skill_ids[skill] = len(self.skills)
+                    self.skills.append(skill)
+                mask |= 1 << skill_id
+                self.postings[skill_id].append(author)
+            self.author_masks[author] = mask
+
+        self.size = len(author_skills)
+
+    def mask(self, skills):
+        # bitmask of the given skills, skills nobody holds are dropped
+        mask = 0
+        for skill in skills:
+            skill_id = self.skill_ids.get(skill)
+            if skill_id is not None:
+                mask |= 1 << skill_id
+        return mask
+
+    def skills_of(self, mask):
+        return {self.skills[i] for i in range(mask.bit_length()) if mask >> i & 1}
+
+    def candidates(self, skills):
+        # authors holding at least one of the skills, in author_skills order
+        authors = set()
+        for skill in skills:
+            skill_id = self.skill_ids.get(skill)
+            if skill_id is not None:
+                authors.update(self.postings[skill_id])
+        return sorted(authors, key=self.author_order.__getitem__)
+
+# one index per author_skills dict, shared by every algorithm call on that dataset
+_index_cache = {}
+
+def get_skill_index(author_skills):
+    key = id(author_skills)
+    cached = _index_cache.get(key)
+    if cached is not None and cached[0] is author_skills and cached[1].size == len(author_skills):
+        return cached[1]
+
+    if len(_index_cache) >= 8:
+        _index_cache.clear()
+    index = SkillIndex(author_skills)
+    # keep a reference to author_skills so its id cannot be reused while cached
+    _index_cache[key] = (author_skills, index)
+    return index
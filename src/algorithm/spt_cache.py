@@ -0,0 +1,182 @@
+import threading
+import numpy as np
+import scipy.sparse as sp
+from collections import OrderedDict
+from scipy.sparse.csgraph import dijkstra
+
+# Shared LRU cache of single-source shortest path trees.
+# Every tree is a pair of arrays over the graph's node order: float64 distances and
+# int32 predecessors (-9999 = source / unreachable, as returned by scipy). Trees are
+# evicted least recently used first once their total size exceeds max_bytes.
+# Graphs are converted to CSR once and identified by object identity plus their
+# node/edge counts, so a graph modified in place gets fresh trees. Counting the edges is
+# O(E), so only graph_arrays(G) checks them; the algorithms call it once per run and the
+# per-source lookups (tree, distance, path) only check identity and node count.
+# The cache may be shared by threads (multi-start Steiner runs): bookkeeping is done
+# under a lock, Dijkstra itself runs outside it.
+
+DEFAULT_MAX_BYTES = 256 << 20
+NO_PREDECESSOR = -9999
+
+class ShortestPathTreeCache:
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, max_graphs=4, weight="weight"):
+        self.max_bytes = max_bytes
+        self.max_graphs = max_graphs
+        self.weight = weight
+        self.graphs = OrderedDict()  # id(G) -> (G, fingerprint, nodes, index, matrix)
+        self.trees = OrderedDict()   # (id(G), source) -> (dist, pred)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.RLock()
+
+    def graph_arrays(self, G, validate=True):
+        # (nodes, index, csr matrix) of G, built on first use.
+        # validate=False skips the edge count of a graph already converted.
+        with self.lock:
+            return self._graph_arrays(G) if validate else self._known_arrays(G)
+
+    def _known_arrays(self, G):
+        cached = self.graphs.get(id(G))
+        if cached is not None and cached[0] is G and cached[1][0] == G.number_of_nodes():
+            self.graphs.move_to_end(id(G))
+            return cached[2], cached[3], cached[4]
+        return self._graph_arrays(G)
+
+    def _graph_arrays(self, G):
+        key = id(G)
+        fingerprint = (G.number_of_nodes(), G.number_of_edges())
+        cached = self.graphs.get(key)
+        if cached is not None and cached[0] is G and cached[1] == fingerprint:
+            self.graphs.move_to_end(key)
+            return cached[2], cached[3], cached[4]
+
+        self._drop_graph(key)
+        while len(self.graphs) >= self.max_graphs:
+            self._drop_graph(next(iter(self.graphs)))
+
+        nodes = list(G.nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        rows, cols, weights = [], [], []
+        for u, v, data in G.edges(data=True):
+            w = data.get(self.weight, 1)
+            rows += [index[u], index[v]]
+            cols += [index[v], index[u]]
+            weights += [w, w]
+        # explicit zero weights stay edges in scipy's csgraph routines
+        matrix = sp.csr_matrix((np.asarray(weights, dtype=np.float64), (rows, cols)), shape=(len(nodes), len(nodes)))
+
+        self.graphs[key] = (G, fingerprint, nodes, index, matrix)
+        return nodes, index, matrix
+
+    def _drop_graph(self, key):
+        if self.graphs.pop(key, None) is None:
+            return
+        for tree_key in [k for k in self.trees if k[0] == key]:
+            dist, pred = self.trees.pop(tree_key)
+            self.bytes -= dist.nbytes + pred.nbytes
+
+    def tree(self, G, source):
+        # (dist, pred) arrays of the shortest path tree rooted at source
+        with self.lock:
+            _, index, matrix = self._known_arrays(G)
+            key = (id(G), source)
+            cached = self.trees.get(key)
+            if cached is not None:
+                self.hits += 1
+                self.trees.move_to_end(key)
+                return cached
+            self.misses += 1
+
+        dist, pred = dijkstra(matrix, indices=index[source], return_predecessors=True)
+
+        with self.lock:
+            # another thread may have stored the same tree meanwhile
+            cached = self.trees.get(key)
+            if cached is not None:
+                return cached
+            if key[0] not in self.graphs:
+                # the graph was dropped while Dijkstra ran, do not keep an orphan tree
+                return dist, pred
+            self.trees[key] = (dist, pred)
+            self.bytes += dist.nbytes + pred.nbytes
+
+            # keep at least the tree just computed
+            while self.bytes > self.max_bytes and len(self.trees) > 1:
+                _, (old_dist, old_pred) = self.trees.popitem(last=False)
+                self.bytes -= old_dist.nbytes + old_pred.nbytes
+                self.evictions += 1
+
+        return dist, pred
+
+    def distance(self, G, source, target):
+        if source not in G or target not in G:
+            return float('inf')
+        _, index, _ = self.graph_arrays(G, validate=False)
+        dist, _ = self.tree(G, source)
+        return float(dist[index[target]])
+
+    def path(self, G, source, target):
+        # node list source -> target read from the tree rooted at source, None if unreachable
+        nodes, index, _ = self.graph_arrays(G, validate=False)
+        dist, pred = self.tree(G, source)
+        i = index[target]
+        if not np.isfinite(dist[i]):
+            return None
+        path = [target]
+        while pred[i] != NO_PREDECESSOR:
+            i = pred[i]
+            path.append(nodes[i])
+        path.reverse()
+        return path
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "trees": len(self.trees),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self):
+        with self.lock:
+            self.graphs.clear()
+            self.trees.clear()
+            self.bytes = 0
+
+# process-wide cache shared by every algorithm call (and so by every task of a run).
+# It is opt-in: full trees pay off when many tasks revisit the same terminals and team
+# centers on a small graph, on large graphs the bounded searches of
+# algorithm.shortest_paths touch far less of it.
+_shared_cache = None
+_shared_enabled = False
+
+def get_spt_cache():
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = ShortestPathTreeCache()
+    return _shared_cache
+
+def configure_spt_cache(max_bytes=DEFAULT_MAX_BYTES, max_graphs=4, enabled=True):
+    # replace the shared cache (e.g. to size it for a larger graph) and turn its use by
+    # the algorithms on or off
+    global _shared_cache, _shared_enabled
+    _shared_cache = ShortestPathTreeCache(max_bytes=max_bytes, max_graphs=max_graphs)
+    _shared_enabled = enabled
+    return _shared_cache
+
+def spt_cache_enabled():
+    return _shared_enabled
+
+def resolve_spt_cache(spt_cache=None):
+    # spt_cache argument of the algorithms: None uses the shared cache when it is enabled
+    # (configure_spt_cache), False runs without one, a cache object is used as given
+    if spt_cache is None:
+        return get_spt_cache() if _shared_enabled else None
+    return spt_cache or None
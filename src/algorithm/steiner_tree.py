@@ -1,35 +1,64 @@
-import random
 import networkx as nx
+from .dijkstra_steiner import grow_steiner_tree, grow_steiner_tree_cached
+from .mehlhorn_steiner import mehlhorn_steiner_tree
+from .exact_steiner import exact_steiner_tree, fits_exact
+from .spt_cache import resolve_spt_cache
+from .multi_start import make_rng, draw_starts, best_of_starts
+from .reductions import get_reduction
 
-def steiner_tree(G, required_nodes, return_type='nodes'):
-    
-    if not required_nodes:
-        return set() if return_type == 'nodes' else nx.Graph()
-    
-    T = nx.Graph()  # Initialize the Steiner tree graph
-    # randomly select a starting node
-    tree_nodes = set()
-    current = random.choice(list(required_nodes))
-    tree_nodes.add(current)
+def pairwise_steiner_tree(G, required_nodes, current, oracle=None, cache=None):
+    # Original greedy: shortest path between every (tree node, uncovered node) pair per step.
+    # With a distance oracle the pairs are ranked by oracle lookups and only the
+    # winning pair's path is materialized. With a shortest path tree cache the pairs
+    # are read from the trees of the uncovered nodes.
+    tree_nodes = {current}
+    tree_edges = []
+    if cache is not None and oracle is None:
+        # check G against the cached arrays once, the per-pair lookups only check identity
+        cache.graph_arrays(G)
 
     uncovered = set(required_nodes)
     uncovered.remove(current)
-    
+
     while uncovered:
         min_path = None
         min_weight = float('inf')
+        # ties go to the first pair in string order, independent of set iteration order
+        ordered_tree = sorted(tree_nodes, key=str)
+        ordered_uncovered = sorted(uncovered, key=str)
 
         # iterate through all pairs of nodes in the current tree
-        for u in tree_nodes:
-            for v in uncovered:
-                try:
-                    path = nx.shortest_path(G, source=u, target=v, weight='weight')
-                    weight = nx.path_weight(G, path, weight='weight')
+        if oracle is not None:
+            min_pair = None
+            for u in ordered_tree:
+                for v in ordered_uncovered:
+                    weight = oracle.distance(u, v)
+                    if weight < min_weight:
+                        min_weight = weight
+                        min_pair = (u, v)
+            if min_pair:
+                min_path = oracle.shortest_path(*min_pair)
+        elif cache is not None:
+            min_pair = None
+            for u in ordered_tree:
+                for v in ordered_uncovered:
+                    weight = cache.distance(G, v, u)
                     if weight < min_weight:
                         min_weight = weight
-                        min_path = path
-                except nx.NetworkXNoPath:
-                    continue
+                        min_pair = (u, v)
+            if min_pair:
+                min_path = cache.path(G, min_pair[1], min_pair[0])[::-1]
+        else:
+            for u in ordered_tree:
+                for v in ordered_uncovered:
+                    try:
+                        path = nx.shortest_path(G, source=u, target=v, weight='weight')
+                        weight = nx.path_weight(G, path, weight='weight')
+                        if weight < min_weight:
+                            min_weight = weight
+                            min_path = path
+                    except nx.NetworkXNoPath:
+                        continue
         # if no path is found, break the loop
         if not min_path:
             break
@@ -37,25 +66,113 @@ def steiner_tree(G, required_nodes, return_type='nodes'):
         # add the minimum path to the Steiner tree
         for i in range(len(min_path) - 1):
             u, v = min_path[i], min_path[i + 1]
-            weight = G[u][v]['weight']
-            T.add_edge(u, v, weight=weight)
+            tree_edges.append((u, v, G[u][v]['weight']))
             tree_nodes.add(u)
             tree_nodes.add(v)
 
         uncovered = required_nodes - tree_nodes
 
+    return tree_nodes, tree_edges, uncovered
+
+def check_oracle(method, oracle, reduce=False):
+    # the oracle answers distances in G only, the other engines would silently ignore it
+    if oracle is None:
+        return
+    if method not in ('dijkstra', 'pairwise'):
+        raise ValueError(f"oracle is only supported by the 'dijkstra' and 'pairwise' methods, not '{method}'")
+    if reduce:
+        raise ValueError("oracle cannot be combined with reduce=True")
+
+def _steiner_tree_edges(G, required_nodes, method, oracle, start, cache, rng, seed, n_starts, workers, starts):
+    # (tree_nodes, tree_edges) of the selected engine
+    exact = None
+    if method == 'exact':
+        exact = exact_steiner_tree(G, required_nodes, cache=cache)
+        if exact is None:
+            method = 'dijkstra'
+
+    if exact is not None:
+        tree_nodes, tree_edges, _ = exact
+    elif method == 'mehlhorn':
+        tree_nodes, tree_edges, _ = mehlhorn_steiner_tree(G, required_nodes)
+    elif method in ('dijkstra', 'pairwise'):
+        # an oracle answering by table lookup ranks the (tree node, terminal) pairs itself,
+        # a search-based one (landmarks) would run one A* per pair: 'dijkstra' then keeps
+        # its multi-source growth
+        lookup_oracle = oracle if getattr(oracle, "lookup", False) else None
+
+        def grow(current):
+            if method == 'dijkstra' and lookup_oracle is None and cache is not None:
+                return grow_steiner_tree_cached(G, required_nodes, current, cache)
+            if method == 'dijkstra' and lookup_oracle is None:
+                return grow_steiner_tree(G, required_nodes, current)
+            return pairwise_steiner_tree(G, set(required_nodes), current, oracle=oracle, cache=cache)
+
+        # randomly select the starting node(s) (unless the caller already drew one)
+        if start is not None:
+            starts = [start]
+        elif not starts:
+            starts = draw_starts(required_nodes, make_rng(rng, seed), n_starts)
+        tree_nodes, tree_edges, _ = best_of_starts(G, starts, grow, workers=workers)
+    else:
+        raise ValueError("method must be 'dijkstra', 'pairwise', 'mehlhorn' or 'exact'")
+    return tree_nodes, tree_edges
+
+def steiner_tree(G, required_nodes, return_type='nodes', method='dijkstra', oracle=None, start=None,
+                 spt_cache=None, rng=None, seed=None, n_starts=1, workers=None, starts=None, reduce=False):
+
+    if not required_nodes:
+        return set() if return_type == 'nodes' else nx.Graph()
+
+    # 'dijkstra': one multi-source Dijkstra per attached terminal
+    # 'pairwise': original per-pair shortest path search
+    # 'mehlhorn': deterministic Voronoi/MST 2-approximation
+    # 'exact': optimal tree by subset DP, 'dijkstra' above the exact terminal limit
+    # spt_cache: None uses the shared shortest path tree cache if enabled, False runs without one
+    # rng / seed: source of the random start terminal (default: the global RNG)
+    # n_starts: grow from that many start terminals and keep the cheapest tree
+    # start / starts: start terminal(s) already drawn by the caller
+    # oracle: distance oracle of G, used by 'dijkstra' and 'pairwise' only
+    # reduce: search the reduced graph of algorithm.reductions and expand the tree back
+    #         to G (the cache applies only when the shared kernel is searched as is)
+    check_oracle(method, oracle, reduce)
+    cache = resolve_spt_cache(spt_cache)
+    if reduce:
+        reduction = get_reduction(G)
+        H = reduction.instance(G, required_nodes)
+        # exact or not is decided on G, as without the reduction
+        if method == 'exact' and not fits_exact(G, required_nodes):
+            method = 'dijkstra'
+        H_cache = cache if H is reduction.kernel else None
+        tree_nodes, tree_edges = _steiner_tree_edges(H, required_nodes, method, None, start, H_cache, rng, seed,
+                                                     n_starts, workers, starts)
+        tree_nodes, tree_edges = reduction.expand(G, tree_nodes, tree_edges, required_nodes)
+    else:
+        tree_nodes, tree_edges = _steiner_tree_edges(G, required_nodes, method, oracle, start, cache, rng, seed,
+                                                     n_starts, workers, starts)
+
     # return the Steiner tree as either a set of nodes or a subgraph
     if return_type == 'nodes':
         return tree_nodes
     elif return_type == 'graph':
+        T = nx.Graph()
+        T.add_weighted_edges_from(tree_edges)
         return T
     else:
         raise ValueError("return_type must be 'nodes' or 'graph'")
 
-def steiner_tree_nodes(G, required_nodes):
+def steiner_tree_nodes(G, required_nodes, method='dijkstra', oracle=None, start=None, spt_cache=None,
+                       rng=None, seed=None, n_starts=1, workers=None, starts=None,
+                       reduce=False):
     # Use the steiner_tree function to get nodes
-    return steiner_tree(G, required_nodes, return_type='nodes')
+    return steiner_tree(G, required_nodes, return_type='nodes', method=method, oracle=oracle, start=start,
+                        spt_cache=spt_cache, rng=rng, seed=seed, n_starts=n_starts, workers=workers,
+                        starts=starts, reduce=reduce)
 
-def steiner_tree_graph(G, required_nodes):
+def steiner_tree_graph(G, required_nodes, method='dijkstra', oracle=None, start=None, spt_cache=None,
+                       rng=None, seed=None, n_starts=1, workers=None, starts=None,
+                       reduce=False):
     # Use the steiner_tree function to get the subgraph
-    return steiner_tree(G, required_nodes, return_type='graph')
\ No newline at end of file
+    return steiner_tree(G, required_nodes, return_type='graph', method=method, oracle=oracle, start=start,
+                        spt_cache=spt_cache, rng=rng, seed=seed, n_starts=n_starts, workers=workers,
+                        starts=starts, reduce=reduce)
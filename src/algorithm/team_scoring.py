@@ -0,0 +1,56 @@
+from .skill_index import get_skill_index, popcount
+
+def team_cost(G, team, weight="weight"):
+    # Communication cost of a team: Kruskal with union-find over the edges induced by
+    # the team, giving (mst_cost, is_connected) in one pass. mst_cost is 0 for a single
+    # author, an empty team or a team that is not connected.
+    members = [author for author in team if author in G]
+    if not members:
+        return 0, False
+    if len(members) == 1:
+        return 0, True
+
+    position = {author: i for i, author in enumerate(members)}
+    edges = []
+    for u in members:
+        i = position[u]
+        for v, data in G[u].items():
+            j = position.get(v)
+            if j is not None and i < j:
+                edges.append((data.get(weight, 1), i, j))
+    edges.sort()
+
+    parent = list(range(len(members)))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    mst_cost = 0
+    merged = 0
+    for w, i, j in edges:
+        root_i, root_j = find(i), find(j)
+        if root_i == root_j:
+            continue
+        parent[root_i] = root_j
+        mst_cost += w
+        merged += 1
+        if merged == len(members) - 1:
+            return mst_cost, True
+
+    return 0, False
+
+def team_coverage(author_skills, team, T, index=None):
+    # Number of skills of T held by at least one team member, from the skill bitsets
+    index = index or get_skill_index(author_skills)
+    covered = 0
+    for author in team:
+        covered |= index.author_masks.get(author, 0)
+    return popcount(covered & index.mask(T))
+
+def score_team(G, author_skills, team, T, weight="weight"):
+    # (mst_cost, is_connected, covered_skills) of a team for skill set T
+    mst_cost, is_connected = team_cost(G, team, weight)
+    return mst_cost, is_connected, team_coverage(author_skills, team, T)
@@ -14,17 +14,23 @@ def create_category_mapping():
             conf_to_category[conf.upper()] = cat
     return conf_to_category
 
+def classify_paper(paper, conf_to_category):
+    # Tag a single paper with its conference abbreviation and category, None if unmapped
+    raw_proceeding = paper.get("proceeding", "")
+    conf_abbr = raw_proceeding.strip().split()[0].upper()
+    category = conf_to_category.get(conf_abbr)
+
+    if not category:
+        return None
+    paper["proceeding"] = conf_abbr
+    paper["category"] = category
+    return paper
+
 def classify_papers(papers, conf_to_category):
     # Classify papers based on their proceeding information
     classified_papers = []
     for paper in papers:
-        raw_proceeding = paper.get("proceeding", "")
-        conf_abbr = raw_proceeding.strip().split()[0].upper()
-        category = conf_to_category.get(conf_abbr)
-        
-        if category:
-            paper["proceeding"] = conf_abbr
-            paper["category"] = category
+        if classify_paper(paper, conf_to_category):
             classified_papers.append(paper)
     
     return classified_papers
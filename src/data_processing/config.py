@@ -8,8 +8,12 @@ DATA_PATHS = {
     "raw_papers": os.path.join(PROJECT_ROOT, "data", "raw", "papers-with-abstracts.json"),
     "filtered_papers": os.path.join(PROJECT_ROOT, "data", "processed", "filtered_papers.json"),
     "classified_papers": os.path.join(PROJECT_ROOT, "data", "processed", "filtered_papers_classified.json"),
+    "pipeline_state": os.path.join(PROJECT_ROOT, "data", "processed", "pipeline_state.json"),
     "author_skills": os.path.join(PROJECT_ROOT, "data", "processed", "author_skills.json"),
+    "skill_vocabulary": os.path.join(PROJECT_ROOT, "data", "processed", "skill_vocabulary.json"),
     "graph_gexf": os.path.join(PROJECT_ROOT, "data", "processed", "graph", "paperswithcode_graph_filtered.gexf"),
+    "distance_oracle": os.path.join(PROJECT_ROOT, "data", "processed", "graph", "distance_oracle"),
+    "graph_layout": os.path.join(PROJECT_ROOT, "data", "visualized", "graph_layout.npz"),
     "graph_png": os.path.join(PROJECT_ROOT, "data", "visualized", "paperswithcode_graph_filtered.png")
 }
 
@@ -26,4 +30,7 @@ PROCESSING_CONFIG = {
     "min_papers_per_author": 3,
     "min_coauthor_papers": 2,
     "min_skill_frequency": 2,
+    "task_cache_size": 1 << 16,     # distinct raw task strings memoized by normalize_task
+    "render_max_nodes": 100000,     # --render skips the PNG above this many authors
+    "render_spring_max_nodes": 2000,    # spring layout up to here, spectral layout above
 }
\ No newline at end of file
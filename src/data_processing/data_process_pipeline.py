@@ -1,8 +1,11 @@
 import os
+import argparse
 from config import DATA_PATHS
 import raw_data_processing
 import analysis
 import graph
+import incremental_update
+import graph_render
 
 def ensure_directories():
     for path in DATA_PATHS.values():
@@ -11,7 +14,76 @@ def ensure_directories():
             os.makedirs(directory)
             print(f"create directory: {directory}")
 
-def run_full_pipeline():
+def stream_classified_papers(save_intermediate=False):
+    # Raw dump -> filter -> classify in one pass, only the classified papers are kept.
+    # With save_intermediate the filtered/classified files of the staged pipeline are
+    # written as well (same contents).
+    conf_to_category = analysis.create_category_mapping()
+    classified_papers = []
+    scanned = 0
+    filtered = 0
+
+    filtered_file = open(DATA_PATHS["filtered_papers"], "w", encoding="utf-8") if save_intermediate else None
+    try:
+        for paper in raw_data_processing.iter_raw_papers():
+            scanned += 1
+            projected = raw_data_processing.project_paper(paper)
+            if projected is None:
+                continue
+
+            # written before classify_paper rewrites the proceeding field
+            if filtered_file:
+                raw_data_processing.write_array_item(filtered_file, projected, filtered)
+            filtered += 1
+
+            if analysis.classify_paper(projected, conf_to_category):
+                classified_papers.append(projected)
+
+        if filtered_file:
+            raw_data_processing.close_array(filtered_file, filtered)
+    finally:
+        if filtered_file:
+            filtered_file.close()
+
+    print(f"Scanned {scanned} raw papers, {filtered} with proceeding information")
+    if save_intermediate:
+        print(f"Saved {filtered} papers to {DATA_PATHS['filtered_papers']}")
+        analysis.save_classified_papers(classified_papers)
+    print(f"Classification complete, retained {len(classified_papers)} papers in CV/AI/DM/DB categories")
+
+    return classified_papers
+
+def run_fused_pipeline(save_intermediate=False, workers=1, render=False, incremental_state=False):
+    # Single pass without the filtered/classified JSON round-trips between stages
+    print("\nStep 1/2: Filter and classify raw data")
+    classified_papers = stream_classified_papers(save_intermediate=save_intermediate)
+
+    print("\nStep 2/2: Build co-authorship network")
+    G = graph.build_network(classified_papers, workers=workers, render=render)
+
+    # classified papers by title, the starting point of incremental_update
+    if incremental_state:
+        incremental_update.save_state(classified_papers)
+    return G
+
+def run_staged_pipeline(workers=1, render=False, incremental_state=False):
+    # Original stage-by-stage flow, every stage reads the previous stage's JSON file
+    print("\nStep 1/3: Process raw data")
+    raw_data_processing.main()
+
+    # Step 2: Paper classification
+    print("\nStep 2/3: Paper classification")
+    classified_papers = analysis.main()
+
+    # Step 3: Build co-authorship network
+    print("\nStep 3/3: Build co-authorship network")
+    G = graph.main(workers=workers, render=render)
+
+    if incremental_state:
+        incremental_update.save_state(classified_papers)
+    return G
+
+def run_full_pipeline(fused=True, save_intermediate=False, workers=1, render=False, incremental_state=False):
     # Run the full data processing pipeline
     print("=" * 50)
     print("starting data processing pipeline")
@@ -19,27 +91,41 @@ def run_full_pipeline():
 
     # Ensure directories exist
     ensure_directories()
-    
+
     try:
-        # Step 1: Raw data processing
-        print("\nStep 1/3: Process raw data")
-        raw_data_processing.main()
-        
-        # Step 2: Paper classification
-        print("\nStep 2/3: Paper classification")
-        analysis.main()
-
-        # Step 3: Build co-authorship network
-        print("\nStep 3/3: Build co-authorship network")
-        graph.main()
-        
+        if fused:
+            run_fused_pipeline(save_intermediate=save_intermediate, workers=workers, render=render,
+                               incremental_state=incremental_state)
+        else:
+            run_staged_pipeline(workers=workers, render=render, incremental_state=incremental_state)
+
+        # the PNG is rendered in the background while the data stages finish
+        graph_render.wait_for_renders()
+
         print("\n" + "=" * 50)
         print("Data processing pipeline complete!")
         print("=" * 50)
-        
+
     except Exception as e:
         print(f"Error occurred during processing: {e}")
         raise
 
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Paper data processing pipeline")
+    parser.add_argument('--staged', action='store_true',
+                        help='run the stages separately through the intermediate JSON files')
+    parser.add_argument('--save-intermediate', action='store_true',
+                        help='fused mode: also write filtered_papers.json and filtered_papers_classified.json')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='processes for the sharded author aggregation / skill extraction')
+    parser.add_argument('--render', action='store_true',
+                        help='also render the collaboration network PNG (background process)')
+    parser.add_argument('--incremental-state', action='store_true',
+                        help='also write pipeline_state.json, required by incremental_update.py')
+    return parser.parse_args()
+
 if __name__ == "__main__":
-    run_full_pipeline()
\ No newline at end of file
+    args = parse_arguments()
+    run_full_pipeline(fused=not args.staged, save_intermediate=args.save_intermediate, workers=args.workers,
+                      render=args.render, incremental_state=args.incremental_state)
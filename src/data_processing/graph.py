@@ -1,10 +1,13 @@
 import json
-import re
 import itertools
+import multiprocessing
+import numpy as np
+import scipy.sparse as sp
 import networkx as nx
-import matplotlib.pyplot as plt
 from collections import defaultdict, Counter
 from config import CATEGORY_MAP, DATA_PATHS, PROCESSING_CONFIG
+from graph_render import render_graph_async
+from skill_normalization import normalize_task, report_cache_stats, save_skill_vocabulary
 
 def load_classified_papers():
     # Load classified papers from the specified path
@@ -43,37 +46,37 @@ def filter_active_authors(author_papers, min_papers=None):
     print(f"Active authors (>= {min_papers} papers): {len(filtered_authors)}")
     return filtered_authors
 
-def extract_author_skills_from_tasks(filtered_authors, papers):
-    # Extract author skills from the tasks field of papers
-    min_frequency = PROCESSING_CONFIG["min_skill_frequency"]
-    
-    # Build author-task mapping
+def count_author_tasks(papers, authors=None):
+    # Per-author Counter of normalized tasks, restricted to authors if given
     author_task_counter = defaultdict(Counter)
 
     # Count occurrences of each task for each author
     for paper in papers:
-        authors = paper.get("authors", [])
+        paper_authors = paper.get("authors", [])
         tasks = paper.get("tasks", [])
         
-        for author in authors:
-            if author in filtered_authors:  # active authors only
+        for author in paper_authors:
+            if authors is None or author in authors:
                 for task in tasks:
                     if task:  # ensure task is not empty
-                        # Normalize task name
-                        # Remove brackets and their contents (including () [] {})
-                        normalized_task = re.sub(r'[\(\[\{][^\)\]\}]*[\)\]\}]', '', task.strip())
-                        # Replace punctuation with spaces
-                        normalized_task = re.sub(r'[^\w\s]', ' ', normalized_task)
-                        # Merge multiple consecutive spaces into a single space
-                        normalized_task = re.sub(r'\s+', ' ', normalized_task)
-                        # Convert to lowercase and strip leading/trailing spaces
-                        normalized_task = normalized_task.lower().strip()
+                        normalized_task = normalize_task(task)
                         if normalized_task:
                             author_task_counter[author][normalized_task] += 1
-    
-    # construct author skills set
+    return author_task_counter
+
+def extract_author_skills_from_tasks(filtered_authors, papers):
+    # Extract author skills from the tasks field of papers (active authors only)
+    author_task_counter = count_author_tasks(papers, filtered_authors)
+    report_cache_stats()
+    return select_author_skills(filtered_authors, author_task_counter)
+
+def select_author_skills(filtered_authors, author_task_counter):
+    # Keep the tasks an active author worked on at least min_skill_frequency times
+    min_frequency = PROCESSING_CONFIG["min_skill_frequency"]
+
+    # construct author skills set, in sorted author order so the output is reproducible
     author_skills = {}
-    for author in filtered_authors:
+    for author in sorted(filtered_authors):
         skills = set()
         for task, count in author_task_counter[author].items():
             if count >= min_frequency:
@@ -102,36 +105,106 @@ def extract_author_skills_from_tasks(filtered_authors, papers):
 
     return author_skills
 
+def _aggregate_shard(papers):
+    # Map step: author data and task counters of one shard, counted for every author
+    # because the activity filter needs the merged paper counts
+    author_papers, author_categories = build_author_data(papers)
+    return author_papers, author_categories, count_author_tasks(papers)
+
+def build_author_data_sharded(papers, workers, shards=None):
+    # Split papers into contiguous shards, aggregate them in a process pool and merge.
+    # Shards are merged in order, so author order matches build_author_data.
+    if shards is None:
+        shards = workers * 4
+    shard_size = max(1, -(-len(papers) // shards))
+    paper_shards = [papers[i:i + shard_size] for i in range(0, len(papers), shard_size)]
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context("spawn")
+
+    author_papers = defaultdict(set)
+    author_categories = defaultdict(set)
+    author_task_counter = defaultdict(Counter)
+
+    with context.Pool(processes=workers) as pool:
+        # reduce step
+        for shard_papers, shard_categories, shard_counter in pool.imap(_aggregate_shard, paper_shards):
+            for author, titles in shard_papers.items():
+                author_papers[author].update(titles)
+            for author, categories in shard_categories.items():
+                author_categories[author].update(categories)
+            for author, counter in shard_counter.items():
+                author_task_counter[author].update(counter)
+
+    return author_papers, author_categories, author_task_counter
+
 def save_author_skills(author_skills):
     # Save author skills to JSON file
-    author_skills_json = {author: list(skills) for author, skills in author_skills.items()}
+    author_skills_json = {author: sorted(skills) for author, skills in author_skills.items()}
     with open(DATA_PATHS["author_skills"], "w", encoding="utf-8") as f:
         json.dump(author_skills_json, f, indent=2, ensure_ascii=False)
     print(f"Author skills saved to {DATA_PATHS['author_skills']}")
 
-def build_collaboration_graph(author_skills, author_papers, author_categories):
+def pairwise_coauthorship_edges(authors, author_papers, min_coauthor_papers):
+    # Original builder: intersect the title sets of every pair of authors
+    edges = []
+    for a1, a2 in itertools.combinations(authors, 2):
+        papers1 = author_papers[a1]
+        papers2 = author_papers[a2]
+        common_papers = papers1 & papers2
+        
+        if len(common_papers) >= min_coauthor_papers:
+            jaccard_dist = 1 - len(papers1 & papers2) / len(papers1 | papers2)
+            edges.append((a1, a2, jaccard_dist))
+    return edges
+
+def sparse_coauthorship_edges(authors, author_papers, min_coauthor_papers):
+    # Co-authorship counts as the sparse product AᵀA of the paper × author incidence
+    # matrix A, Jaccard distances from the per-author paper counts. Edges come out in
+    # the same (i < j) order as itertools.combinations(authors, 2).
+    title_ids = {}
+    rows, cols = [], []
+    for j, author in enumerate(authors):
+        for title in author_papers[author]:
+            rows.append(title_ids.setdefault(title, len(title_ids)))
+            cols.append(j)
+
+    A = sp.csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, cols)),
+                      shape=(len(title_ids), len(authors)))
+    coauthored = sp.triu(A.T @ A, k=1).tocoo()
+
+    keep = coauthored.data >= min_coauthor_papers
+    i, j, common = coauthored.row[keep], coauthored.col[keep], coauthored.data[keep]
+    order = np.lexsort((j, i))
+    i, j, common = i[order], j[order], common[order].astype(np.float64)
+
+    # |P1 ∪ P2| = |P1| + |P2| - |P1 ∩ P2|
+    paper_counts = np.asarray(A.sum(axis=0)).ravel().astype(np.float64)
+    jaccard_dist = 1 - common / (paper_counts[i] + paper_counts[j] - common)
+
+    return [(authors[a1], authors[a2], dist) for a1, a2, dist in zip(i.tolist(), j.tolist(), jaccard_dist.tolist())]
+
+def build_collaboration_graph(author_skills, author_papers, author_categories, method="sparse"):
     # Build the co-authorship graph
+    # method="sparse": AᵀA sparse product (default), method="pairwise": original pair loop
     min_coauthor_papers = PROCESSING_CONFIG["min_coauthor_papers"]
     
     G = nx.Graph()
     G.add_nodes_from(author_skills.keys())
     
-    edges_added = 0
-    example_edges = []
-    
     # Calculate Jaccard distance between authors based on shared papers
-    for a1, a2 in itertools.combinations(author_skills.keys(), 2):
-        papers1 = author_papers[a1]
-        papers2 = author_papers[a2]
-        common_papers = papers1 & papers2
-        
-        if len(common_papers) >= min_coauthor_papers:
-            jaccard_dist = 1 - len(papers1 & papers2) / len(papers1 | papers2)
-            G.add_edge(a1, a2, weight=jaccard_dist)
-            edges_added += 1
-            
-            if len(example_edges) < 5:
-                example_edges.append((a1, a2, round(jaccard_dist, 3)))
+    authors = list(author_skills.keys())
+    if method == "sparse" and min_coauthor_papers >= 1:
+        edges = sparse_coauthorship_edges(authors, author_papers, min_coauthor_papers)
+    else:
+        # pairs without any shared paper only qualify when the threshold is 0
+        edges = pairwise_coauthorship_edges(authors, author_papers, min_coauthor_papers)
+
+    G.add_weighted_edges_from(edges)
+    edges_added = len(edges)
+    example_edges = [(a1, a2, round(jaccard_dist, 3)) for a1, a2, jaccard_dist in edges[:5]]
 
     # Add node attributes
     for author in G.nodes():
@@ -146,48 +219,55 @@ def build_collaboration_graph(author_skills, author_papers, author_categories):
 
     return G
 
-def save_graph(G):
-    # Save graph data and visualization
+def save_graph(G, render=False):
+    # Save graph data, the visualization is opt-in and rendered in a background process
     # Save GEXF format
     nx.write_gexf(G, DATA_PATHS["graph_gexf"])
-
-    # Generate visualization
-    plt.figure(figsize=(12, 8))
-    nx.draw(G, node_size=30, edge_color="gray", alpha=0.3, with_labels=False)
-    plt.title(f"Author Collaboration Network (>={PROCESSING_CONFIG['min_coauthor_papers']} co-authored papers)")
-    plt.axis("off")
-    plt.savefig(DATA_PATHS["graph_png"], dpi=300, bbox_inches='tight')
-    plt.close()
-
     print(f"Graph data saved to: {DATA_PATHS['graph_gexf']}")
-    print(f"Visualization saved to: {DATA_PATHS['graph_png']}")
 
-def main():
-    # Main function to build the author collaboration network
-    print("Starting to build author collaboration network...")
+    # Generate visualization
+    if render:
+        render_graph_async(G)
 
-    # Load data
-    papers = load_classified_papers()
-    print(f"Loaded {len(papers)} classified papers")
+def build_network(papers, workers=1, render=False):
+    # Author aggregation, skill extraction and graph construction from classified papers
+    # workers > 1: shard the aggregation across a process pool
+    if workers > 1:
+        author_papers, author_categories, author_task_counter = build_author_data_sharded(papers, workers)
+        print(f"Found {len(author_papers)} authors ({workers} workers)")
 
-    # Build author data
-    author_papers, author_categories = build_author_data(papers)
-    print(f"Found {len(author_papers)} authors")
+        filtered_authors = filter_active_authors(author_papers)
+        author_skills = select_author_skills(filtered_authors, author_task_counter)
+    else:
+        # Build author data
+        author_papers, author_categories = build_author_data(papers)
+        print(f"Found {len(author_papers)} authors")
 
-    # Filter active authors
-    filtered_authors = filter_active_authors(author_papers)
+        # Filter active authors
+        filtered_authors = filter_active_authors(author_papers)
 
-    # Extract skills from tasks field
-    author_skills = extract_author_skills_from_tasks(filtered_authors, papers)
+        # Extract skills from tasks field
+        author_skills = extract_author_skills_from_tasks(filtered_authors, papers)
     save_author_skills(author_skills)
+    save_skill_vocabulary(author_skills)
 
     # Build graph
     G = build_collaboration_graph(author_skills, author_papers, author_categories)
-    save_graph(G)
+    save_graph(G, render=render)
 
     print(f"Network statistics: {G.number_of_nodes()} nodes (authors), {G.number_of_edges()} edges (collaborations)")
 
     return G
 
+def main(workers=1, render=False):
+    # Main function to build the author collaboration network
+    print("Starting to build author collaboration network...")
+
+    # Load data
+    papers = load_classified_papers()
+    print(f"Loaded {len(papers)} classified papers")
+
+    return build_network(papers, workers=workers, render=render)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,148 @@
+import os
+import json
+import hashlib
+import numpy as np
+import networkx as nx
+
+# Binary cache of the collaboration graph written next to the GEXF file:
+#   <graph>.gexf.cache/indptr.npy, indices.npy, weights.npy   CSR adjacency (both directions)
+#   <graph>.gexf.cache/skill_bits.npy                         packed per-author skill bitsets
+#   <graph>.gexf.cache/meta.json                              node names, skill vocabulary, source signature
+# Arrays are memory-mapped on load, the cache is rebuilt when the GEXF file changes.
+
+CACHE_VERSION = 1
+
+def cache_directory(gexf_path):
+    return gexf_path + ".cache"
+
+def _file_hash(path):
+    sha1 = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+def _split_attribute(value):
+    # GEXF attributes are comma-joined strings, occasionally wrapped in a dict
+    if isinstance(value, dict):
+        value = value.get("value", "")
+    return [item.strip() for item in str(value).split(",") if item.strip()]
+
+def build_graph_cache(gexf_path):
+    # Parse the GEXF once and write the CSR arrays and skill bitsets next to it
+    G = nx.read_gexf(gexf_path, node_type=str)
+
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+
+    # CSR adjacency
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+    indices = []
+    weights = []
+    for i, node in enumerate(nodes):
+        for nbr, data in G[node].items():
+            indices.append(index[nbr])
+            weights.append(data.get("weight", 1.0))
+        indptr[i + 1] = len(indices)
+
+    # skills as packed bitsets over a sorted vocabulary
+    node_skills = [_split_attribute(G.nodes[node].get("skills", "")) for node in nodes]
+    skills = sorted({skill for skill_list in node_skills for skill in skill_list})
+    skill_index = {skill: i for i, skill in enumerate(skills)}
+    skill_matrix = np.zeros((len(nodes), max(len(skills), 1)), dtype=bool)
+    for i, skill_list in enumerate(node_skills):
+        for skill in skill_list:
+            skill_matrix[i, skill_index[skill]] = True
+
+    directory = cache_directory(gexf_path)
+    os.makedirs(directory, exist_ok=True)
+    np.save(os.path.join(directory, "indptr.npy"), indptr)
+    np.save(os.path.join(directory, "indices.npy"), np.asarray(indices, dtype=np.int32))
+    np.save(os.path.join(directory, "weights.npy"), np.asarray(weights, dtype=np.float64))
+    np.save(os.path.join(directory, "skill_bits.npy"), np.packbits(skill_matrix, axis=1))
+
+    stat = os.stat(gexf_path)
+    meta = {
+        "version": CACHE_VERSION,
+        "source_mtime_ns": stat.st_mtime_ns,
+        "source_size": stat.st_size,
+        "source_sha1": _file_hash(gexf_path),
+        "nodes": nodes,
+        "skills": skills,
+        "categories": [", ".join(_split_attribute(G.nodes[node].get("categories", ""))) for node in nodes],
+    }
+    with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+    print(f" Graph cache written to {directory}")
+
+def _cache_is_fresh(gexf_path, meta):
+    # mtime + size is the fast path, the content hash settles touched-but-unchanged files
+    if meta.get("version") != CACHE_VERSION:
+        return False
+    stat = os.stat(gexf_path)
+    if stat.st_mtime_ns == meta["source_mtime_ns"] and stat.st_size == meta["source_size"]:
+        return True
+    if stat.st_size != meta["source_size"] or _file_hash(gexf_path) != meta["source_sha1"]:
+        return False
+
+    meta["source_mtime_ns"] = stat.st_mtime_ns
+    with open(os.path.join(cache_directory(gexf_path), "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    return True
+
+def load_graph_cache(gexf_path):
+    # Memory-map the cached arrays, building or refreshing the cache first if needed
+    directory = cache_directory(gexf_path)
+    meta_path = os.path.join(directory, "meta.json")
+
+    meta = None
+    if os.path.exists(meta_path):
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+
+    if meta is None or not _cache_is_fresh(gexf_path, meta):
+        build_graph_cache(gexf_path)
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+
+    cache = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r')
+             for name in ("indptr", "indices", "weights", "skill_bits")}
+    cache.update(nodes=meta["nodes"], skills=meta["skills"], categories=meta["categories"])
+    return cache
+
+def node_skills(cache, i):
+    # decode the skill set of node i from its packed bitset
+    bits = np.unpackbits(cache["skill_bits"][i], count=len(cache["skills"]))
+    return {cache["skills"][j] for j in np.flatnonzero(bits)}
+
+def cache_to_graph(cache, with_attributes=False):
+    # Rebuild a networkx graph from the CSR arrays (each undirected edge stored once)
+    nodes = cache["nodes"]
+    indptr = np.asarray(cache["indptr"])
+    indices = np.asarray(cache["indices"])
+    weights = np.asarray(cache["weights"])
+
+    rows = np.repeat(np.arange(len(nodes)), np.diff(indptr))
+    upper = rows < indices
+
+    G = nx.Graph()
+    G.add_nodes_from(nodes)
+    G.add_weighted_edges_from(zip(
+        (nodes[i] for i in rows[upper].tolist()),
+        (nodes[j] for j in indices[upper].tolist()),
+        weights[upper].tolist(),
+    ))
+
+    if with_attributes:
+        for i, node in enumerate(nodes):
+            skills = node_skills(cache, i)
+            G.nodes[node]["num_skills"] = len(skills)
+            G.nodes[node]["skills"] = ", ".join(sorted(skills))
+            G.nodes[node]["categories"] = cache["categories"][i]
+
+    return G
+
+def load_graph(gexf_path, with_attributes=False):
+    # Drop-in replacement for nx.read_gexf(gexf_path, node_type=str) backed by the cache
+    return cache_to_graph(load_graph_cache(gexf_path), with_attributes=with_attributes)
@@ -0,0 +1,113 @@
+import os
+import multiprocessing
+import numpy as np
+import networkx as nx
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+from config import DATA_PATHS, PROCESSING_CONFIG
+
+# Optional PNG rendering of the collaboration network.
+# Positions are cached in DATA_PATHS["graph_layout"]: a rebuild only places the new
+# authors and an unchanged node set skips the layout.
+# Edges are drawn as one LineCollection instead of one artist per edge.
+
+# render processes started by render_graph_async, joined by wait_for_renders
+_render_processes = []
+
+def load_layout(path=None):
+    path = path or DATA_PATHS["graph_layout"]
+    if not os.path.exists(path):
+        return {}
+    data = np.load(path)
+    return dict(zip(data["nodes"].tolist(), data["positions"]))
+
+def save_layout(pos, path=None):
+    path = path or DATA_PATHS["graph_layout"]
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    nodes = list(pos)
+    np.savez(path, nodes=np.array(nodes, dtype=str), positions=np.array([pos[node] for node in nodes]))
+
+def place_new_nodes(G, pos, seed=42):
+    # new authors go next to the mean of their already placed co-authors (random if none)
+    rng = np.random.default_rng(seed)
+    placed = np.array(list(pos.values())) if pos else np.zeros((1, 2))
+    low, high = placed.min(axis=0), placed.max(axis=0)
+    jitter = 0.01 * max(float(np.max(high - low)), 1e-3)
+
+    for node in G.nodes():
+        if node in pos:
+            continue
+        neighbours = [pos[nbr] for nbr in G[node] if nbr in pos]
+        if neighbours:
+            pos[node] = np.mean(neighbours, axis=0) + rng.normal(scale=jitter, size=2)
+        else:
+            pos[node] = rng.uniform(low, high)
+    return pos
+
+def compute_layout(G, seed=42):
+    # Reuse cached positions and only place authors that are new since the last render.
+    # Spring layout (as nx.draw) up to render_spring_max_nodes, spectral layout above.
+    cached = load_layout()
+    pos = {node: cached[node] for node in G.nodes() if node in cached}
+    if len(pos) == G.number_of_nodes():
+        return pos
+
+    if G.number_of_nodes() <= PROCESSING_CONFIG["render_spring_max_nodes"]:
+        # a warm start from the cached positions converges in a few iterations
+        iterations = 10 if pos else 50
+        pos = nx.spring_layout(G, pos=pos or None, iterations=iterations, seed=seed)
+    elif pos:
+        pos = place_new_nodes(G, pos, seed=seed)
+    else:
+        pos = nx.spectral_layout(G)
+
+    save_layout(pos)
+    return pos
+
+def render_graph(G, path=None):
+    # Draw nodes as one scatter and edges as one LineCollection, rasterized with Agg
+    path = path or DATA_PATHS["graph_png"]
+    max_nodes = PROCESSING_CONFIG["render_max_nodes"]
+    if G.number_of_nodes() > max_nodes:
+        print(f"Skipping visualization: {G.number_of_nodes()} nodes > render_max_nodes ({max_nodes})")
+        return None
+
+    pos = compute_layout(G)
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    xy = np.array([pos[node] for node in nodes]).reshape(-1, 2)
+    edges = np.array([(index[u], index[v]) for u, v in G.edges()], dtype=np.int64).reshape(-1, 2)
+
+    fig = Figure(figsize=(12, 8))
+    ax = fig.add_subplot()
+    ax.add_collection(LineCollection(xy[edges], colors="gray", alpha=0.3, linewidths=1.0, zorder=1))
+    ax.scatter(xy[:, 0], xy[:, 1], s=30, c="#1f78b4", alpha=0.3, zorder=2)
+    ax.autoscale_view()
+    ax.set_title(f"Author Collaboration Network (>={PROCESSING_CONFIG['min_coauthor_papers']} co-authored papers)")
+    ax.axis("off")
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fig.savefig(path, dpi=300, bbox_inches='tight')
+    print(f"Visualization saved to: {path}")
+    return path
+
+def render_graph_async(G, path=None):
+    # Render in a background process, the pipeline continues meanwhile
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context("spawn")
+
+    process = context.Process(target=render_graph, args=(G, path))
+    process.start()
+    _render_processes.append(process)
+    print("Rendering visualization in the background...")
+    return process
+
+def wait_for_renders():
+    # Join every background render started in this process
+    while _render_processes:
+        process = _render_processes.pop(0)
+        process.join()
+        if process.exitcode != 0:
+            print(f"Warning: visualization process exited with code {process.exitcode}")
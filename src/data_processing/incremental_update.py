@@ -0,0 +1,202 @@
+import os
+import json
+import argparse
+import networkx as nx
+from collections import defaultdict, Counter
+from config import DATA_PATHS, PROCESSING_CONFIG
+import raw_data_processing
+import analysis
+import graph
+from graph_cache import load_graph
+from skill_normalization import normalize_task, save_skill_vocabulary
+
+# Incremental rebuild from a delta of new or changed papers.
+# The full pipeline run with --incremental-state stores its classified papers grouped by
+# title in DATA_PATHS["pipeline_state"]. A delta replaces every stored paper with the same title,
+# only the authors of those papers are re-evaluated and only their edges are recomputed.
+# The graph and author_skills.json end up equal to a full rebuild on the merged corpus.
+
+STATE_VERSION = 1
+# thresholds the processed data depends on, a change requires a full rebuild
+STATE_CONFIG_KEYS = ("min_papers_per_author", "min_coauthor_papers", "min_skill_frequency")
+
+def state_config():
+    return {key: PROCESSING_CONFIG[key] for key in STATE_CONFIG_KEYS}
+
+def save_state(classified_papers):
+    # Called by the full pipeline after the graph has been built
+    papers_by_title = defaultdict(list)
+    for paper in classified_papers:
+        papers_by_title[paper["title"]].append({
+            "authors": paper["authors"],
+            "proceeding": paper["proceeding"],
+            "tasks": paper["tasks"],
+            "category": paper["category"]
+        })
+
+    write_state({"version": STATE_VERSION, "config": state_config(), "papers": papers_by_title})
+
+def write_state(state):
+    # compact JSON, the state is only read back by this module
+    with open(DATA_PATHS["pipeline_state"], "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+    print(f"Pipeline state saved to {DATA_PATHS['pipeline_state']}")
+
+def load_state():
+    if not os.path.exists(DATA_PATHS["pipeline_state"]):
+        raise FileNotFoundError(f"{DATA_PATHS['pipeline_state']} not found, run the full pipeline with "
+                                "--incremental-state first")
+    with open(DATA_PATHS["pipeline_state"], "r", encoding="utf-8") as f:
+        state = json.load(f)
+
+    # thresholds changed since the last full build -> every author may be affected
+    if state.get("version") != STATE_VERSION or state.get("config") != state_config():
+        raise ValueError("Pipeline state was built with another configuration, run the full pipeline")
+    return state
+
+def classify_delta(delta_path):
+    # Filter and classify the delta papers exactly like the full pipeline.
+    # Titles that no longer qualify map to an empty list so their old papers get dropped.
+    conf_to_category = analysis.create_category_mapping()
+    delta = {}
+    for paper in raw_data_processing.iter_raw_papers(delta_path):
+        records = delta.setdefault(paper["title"], [])
+        projected = raw_data_processing.project_paper(paper)
+        if projected is None or not analysis.classify_paper(projected, conf_to_category):
+            continue
+        records.append({key: projected[key] for key in ("authors", "proceeding", "tasks", "category")})
+    return delta
+
+def author_titles(papers_by_title):
+    # author -> set of paper titles, as graph.build_author_data computes it
+    author_papers = defaultdict(set)
+    for title, records in papers_by_title.items():
+        for record in records:
+            for author in record["authors"]:
+                author_papers[author].add(title)
+    return author_papers
+
+def recompute_author(author, author_papers, papers_by_title):
+    # skills and categories of one author from all of their papers, None if the author drops out
+    titles = author_papers.get(author, set())
+    if len(titles) < PROCESSING_CONFIG["min_papers_per_author"]:
+        return None, set()
+
+    records = [dict(record, title=title) for title in titles for record in papers_by_title[title]]
+    _, author_categories = graph.build_author_data(records)
+
+    task_counter = Counter()
+    for record in records:
+        for name in record["authors"]:
+            if name == author:
+                for task in record["tasks"]:
+                    if task:
+                        normalized_task = normalize_task(task)
+                        if normalized_task:
+                            task_counter[normalized_task] += 1
+
+    skills = {task for task, count in task_counter.items() if count >= PROCESSING_CONFIG["min_skill_frequency"]}
+    return skills or None, author_categories.get(author, set())
+
+def update_author_edges(G, author, author_papers, papers_by_title):
+    # Recompute every edge touching author, edges between unaffected authors stay as they are
+    min_coauthor_papers = PROCESSING_CONFIG["min_coauthor_papers"]
+    papers = author_papers[author]
+
+    if min_coauthor_papers >= 1:
+        candidates = {coauthor for title in papers for record in papers_by_title[title]
+                      for coauthor in record["authors"]}
+    else:
+        candidates = set(G.nodes())
+    candidates = {c for c in candidates if c != author and c in G}
+
+    for other in list(G.neighbors(author)):
+        if other not in candidates:
+            G.remove_edge(author, other)
+
+    for other in candidates:
+        other_papers = author_papers[other]
+        common = len(papers & other_papers)
+        if common >= min_coauthor_papers:
+            G.add_edge(author, other, weight=1 - common / len(papers | other_papers))
+        elif G.has_edge(author, other):
+            G.remove_edge(author, other)
+
+def apply_delta(G, author_skills, state, delta):
+    # Update state, author_skills and G in place, returns the set of affected authors
+    papers_by_title = state["papers"]
+
+    affected = set()
+    for title, records in delta.items():
+        for record in papers_by_title.get(title, []) + records:
+            affected.update(record["authors"])
+        if records:
+            papers_by_title[title] = records
+        else:
+            papers_by_title.pop(title, None)
+
+    author_papers = author_titles(papers_by_title)
+
+    # node set and attributes first, so edges can see newly added authors
+    for author in affected:
+        skills, categories = recompute_author(author, author_papers, papers_by_title)
+        if skills is None:
+            author_skills.pop(author, None)
+            if author in G:
+                G.remove_node(author)
+            continue
+
+        author_skills[author] = skills
+        G.add_node(author)
+        G.nodes[author]["num_skills"] = len(skills)
+        G.nodes[author]["skills"] = ", ".join(sorted(skills))
+        G.nodes[author]["categories"] = ", ".join(sorted(categories))
+
+    for author in affected:
+        if author in G:
+            update_author_edges(G, author, author_papers, papers_by_title)
+
+    return affected
+
+def load_author_skills():
+    with open(DATA_PATHS["author_skills"], "r", encoding="utf-8") as f:
+        return {author: set(skills) for author, skills in json.load(f).items()}
+
+def main(delta_path):
+    """Apply a file of new or changed papers to the processed data"""
+    print(f"Applying paper delta from {delta_path}...")
+    if not os.path.exists(DATA_PATHS["pipeline_state"]):
+        print(f"Error: no pipeline state at {DATA_PATHS['pipeline_state']}. Run "
+              f"data_process_pipeline.py --incremental-state once before applying deltas.")
+        return None
+    state = load_state()
+    delta = classify_delta(delta_path)
+    print(f"Delta contains {len(delta)} titles")
+
+    author_skills = load_author_skills()
+    G = load_graph(DATA_PATHS["graph_gexf"], with_attributes=True)
+
+    affected = apply_delta(G, author_skills, state, delta)
+    print(f"Re-evaluated {len(affected)} affected authors")
+
+    # sorted author order, as written by the full build
+    author_skills = dict(sorted(author_skills.items()))
+    graph.save_author_skills(author_skills)
+    save_skill_vocabulary(author_skills)
+    nx.write_gexf(G, DATA_PATHS["graph_gexf"])
+    print(f"Graph data saved to: {DATA_PATHS['graph_gexf']}")
+    write_state(state)
+
+    print(f"Network statistics: {G.number_of_nodes()} nodes (authors), {G.number_of_edges()} edges (collaborations)")
+    return G
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Incrementally apply new or changed papers")
+    parser.add_argument('delta', help='JSON array of papers in the raw dump format')
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    if main(args.delta) is None:
+        raise SystemExit(1)
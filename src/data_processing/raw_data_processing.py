@@ -6,17 +6,84 @@ def load_raw_data():
     with open(DATA_PATHS["raw_papers"], "r", encoding="utf-8") as f:
         return json.load(f)
 
+def iter_raw_papers(path=None, chunk_size=1 << 20):
+    # Stream the records of a top-level JSON array one at a time.
+    # Only the current record (plus one read chunk) is held in memory.
+    path = path or DATA_PATHS["raw_papers"]
+    decoder = json.JSONDecoder()
+
+    with open(path, "r", encoding="utf-8") as f:
+        buffer = ""
+        pos = 0
+        eof = False
+
+        def fill():
+            # drop the consumed prefix and append the next chunk
+            nonlocal buffer, pos, eof
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+            buffer = buffer[pos:] + chunk
+            pos = 0
+
+        def skip_whitespace():
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos].isspace():
+                    pos += 1
+                if pos < len(buffer) or eof:
+                    return
+                fill()
+
+        skip_whitespace()
+        if pos >= len(buffer) or buffer[pos] != "[":
+            raise ValueError(f"{path} does not contain a top-level JSON array")
+        pos += 1
+
+        skip_whitespace()
+        if pos < len(buffer) and buffer[pos] == "]":
+            return
+
+        while True:
+            skip_whitespace()
+            try:
+                record, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # record cut off by the chunk boundary, read more and retry
+                if eof:
+                    raise
+                fill()
+                continue
+            pos = end
+            yield record
+
+            skip_whitespace()
+            if pos >= len(buffer):
+                raise ValueError(f"{path} ends inside the top-level array")
+            if buffer[pos] == "]":
+                return
+            if buffer[pos] != ",":
+                raise ValueError(f"Expected ',' or ']' in {path}, found {buffer[pos]!r}")
+            pos += 1
+
+def project_paper(paper):
+    # Keep the fields used downstream, None for papers without proceeding information
+    if not paper.get("proceeding"):
+        return None
+    return {
+        "title": paper["title"],
+        "authors": paper["authors"],
+        "proceeding": paper["proceeding"],
+        "tasks": paper["tasks"]
+    }
+
 def filter_papers(raw_data):
     # Filter papers that contain proceeding information
     filtered_data = []
     for paper in raw_data:
-        if paper.get("proceeding"):
-            filtered_data.append({
-                "title": paper["title"],
-                "authors": paper["authors"],
-                "proceeding": paper["proceeding"],
-                "tasks": paper["tasks"]
-            })
+        projected = project_paper(paper)
+        if projected is not None:
+            filtered_data.append(projected)
     return filtered_data
 
 def save_filtered_papers(filtered_data):
@@ -25,15 +92,52 @@ def save_filtered_papers(filtered_data):
         json.dump(filtered_data, f, indent=2, ensure_ascii=False)
     print(f"Saved {len(filtered_data)} papers to {DATA_PATHS['filtered_papers']}")
 
-def main():
+def write_array_item(f, item, index):
+    # Append one element in json.dump(indent=2) layout, elements two spaces deeper
+    text = json.dumps(item, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+    f.write(("[\n  " if index == 0 else ",\n  ") + text)
+
+def close_array(f, count):
+    f.write("\n]" if count else "[]")
+
+def stream_filtered_papers(raw_path=None, output_path=None):
+    # Filter the raw dump record by record and write each kept paper immediately.
+    # The output is byte-identical to save_filtered_papers(filter_papers(load_raw_data())).
+    output_path = output_path or DATA_PATHS["filtered_papers"]
+    scanned = 0
+    saved = 0
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        for paper in iter_raw_papers(raw_path):
+            scanned += 1
+            projected = project_paper(paper)
+            if projected is None:
+                continue
+
+            write_array_item(f, projected, saved)
+            saved += 1
+
+        close_array(f, saved)
+
+    print(f"Scanned {scanned} raw papers")
+    print(f"Saved {saved} papers to {output_path}")
+    return saved
+
+def main(streaming=True):
     """Main processing flow"""
     print("Starting to process raw data...")
+    if streaming:
+        # memory bounded by a single record instead of the whole dump, the filtered
+        # papers are handed back lazily by re-reading the written file
+        stream_filtered_papers()
+        return iter_raw_papers(DATA_PATHS["filtered_papers"])
+
     raw_data = load_raw_data()
     print(f"Loaded {len(raw_data)} raw papers")
 
     filtered_data = filter_papers(raw_data)
     save_filtered_papers(filtered_data)
-    
+
     return filtered_data
 
 if __name__ == "__main__":
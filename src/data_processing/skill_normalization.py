@@ -0,0 +1,43 @@
+import re
+import json
+from functools import lru_cache
+from config import DATA_PATHS, PROCESSING_CONFIG
+
+# Remove brackets and their contents (including () [] {})
+BRACKETS = re.compile(r'[\(\[\{][^\)\]\}]*[\)\]\}]')
+# Punctuation becomes a space
+PUNCTUATION = re.compile(r'[^\w\s]')
+# Runs of whitespace collapse to a single space
+WHITESPACE = re.compile(r'\s+')
+
+@lru_cache(maxsize=PROCESSING_CONFIG["task_cache_size"])
+def normalize_task(task):
+    # Normalize task name, memoized by the raw string: the same task shows up
+    # once per co-author of every paper that mentions it
+    normalized_task = BRACKETS.sub('', task.strip())
+    normalized_task = PUNCTUATION.sub(' ', normalized_task)
+    normalized_task = WHITESPACE.sub(' ', normalized_task)
+    # Convert to lowercase and strip leading/trailing spaces
+    return normalized_task.lower().strip()
+
+def report_cache_stats():
+    # Hit rate of the normalization memo since the start of the run
+    info = normalize_task.cache_info()
+    lookups = info.hits + info.misses
+    hit_rate = info.hits / lookups if lookups else 0.0
+    print(f"task normalization: {lookups} lookups, {info.misses} distinct tasks normalized, "
+          f"hit rate {hit_rate:.1%} (cache {info.currsize}/{info.maxsize})")
+    return hit_rate
+
+def build_skill_vocabulary(author_skills):
+    # skill -> integer id over the sorted normalized vocabulary
+    skills = sorted({skill for author_skill_set in author_skills.values() for skill in author_skill_set})
+    return {skill: skill_id for skill_id, skill in enumerate(skills)}
+
+def save_skill_vocabulary(author_skills):
+    # Save the skill-id table next to author_skills.json
+    vocabulary = build_skill_vocabulary(author_skills)
+    with open(DATA_PATHS["skill_vocabulary"], "w", encoding="utf-8") as f:
+        json.dump(vocabulary, f, indent=2, ensure_ascii=False)
+    print(f"Skill vocabulary ({len(vocabulary)} skills) saved to {DATA_PATHS['skill_vocabulary']}")
+    return vocabulary
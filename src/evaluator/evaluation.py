@@ -1,9 +1,10 @@
 import json
 import time
-import networkx as nx
 import matplotlib.pyplot as plt
 import os
 import sys
+import argparse
+import multiprocessing
 from collections import defaultdict
 
 # add the src directory to the Python path
@@ -12,26 +13,36 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from algorithm.cover_steiner import cover_steiner
 from algorithm.graph_aware_cover_steiner import graph_aware_cover_steiner
 from algorithm.improved_enhance_steiner import improved_enhance_steiner
+from algorithm.batch_teams import form_teams
+from algorithm.spt_cache import get_spt_cache, configure_spt_cache, spt_cache_enabled
+from algorithm.team_scoring import team_coverage
 from data_processing.config import DATA_PATHS
+from data_processing.graph_cache import load_graph
+
+# Algorithms under evaluation
+ALGORITHMS = {
+    "CoverSteiner": cover_steiner,
+    "GraphAwareCoverSteiner": graph_aware_cover_steiner,
+    "ImprovedEnhanceSteiner": improved_enhance_steiner
+}
+
+# graph, author skills and tasks seen by worker processes
+_worker_data = None
+
+# Steiner options of the run: engine method, task i is seeded with seed + i (None = global RNG),
+# budget of the shared shortest path tree cache in MB (None = no cache, bounded searches)
+_steiner_options = {"method": "dijkstra", "seed": None, "n_starts": 1, "spt_cache_mb": None}
 
 def load_data():
     # load graph and author skills from predefined paths
     print(" Loading data...")
     
-    # Load graph
-    G = nx.read_gexf(DATA_PATHS["graph_gexf"], node_type=str)
-    
-    # Normalize node names
-    node_mapping = {node: node.encode('utf-8').decode('utf-8') for node in G.nodes()}
-    G = nx.relabel_nodes(G, node_mapping)
+    # Load graph from the binary cache (rebuilt automatically when the GEXF changes)
+    G = load_graph(DATA_PATHS["graph_gexf"])
 
     # Load author skills
     with open(DATA_PATHS["author_skills"], encoding='utf-8') as f:
-        author_skills_raw = json.load(f)
-        author_skills = {
-            author.encode('utf-8').decode('utf-8'): set(skills) if isinstance(skills, list) else skills
-            for author, skills in author_skills_raw.items()
-        }
+        author_skills = {author: set(skills) for author, skills in json.load(f).items()}
 
     # Load generated tasks
     tasks_file = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 
@@ -45,116 +56,170 @@ def load_data():
 
     return G, author_skills, tasks
 
-def evaluate_task_with_algorithm(G, author_skills, task, algorithm_func, algorithm_name):
+def task_result(author_skills, task, algorithm_name, team, cost, connected, execution_time):
+    """Result record of one task from the team returned by an algorithm"""
+    skill_set = set(task["skills"])
+    team_size = len(team) if team else 0
+
+    # When team size is 1, set communication cost to 0
+    if team_size == 1:
+        cost = 0
+    elif team_size == 0:
+        cost = float('inf')
+
+    # Calculate skill coverage
+    covered_skills = team_coverage(author_skills, team, skill_set) if team else 0
+    
+    return {
+        "algorithm": algorithm_name,
+        "t": task["t"],
+        "s": task["s"],
+        "team_size": team_size,
+        "required_skills": len(skill_set),
+        "covered_skills": covered_skills,
+        "communication_cost": float('inf') if cost is None else cost,
+        "is_connected": connected,
+        "execution_time": execution_time,
+        "success": covered_skills == len(skill_set) and team_size > 0
+    }
+
+def failed_result(task, algorithm_name, error):
+    return {
+        "algorithm": algorithm_name,
+        "t": task["t"],
+        "s": task["s"],
+        "team_size": 0,
+        "required_skills": len(set(task["skills"])),
+        "covered_skills": 0,
+        "communication_cost": float('inf'),
+        "is_connected": False,
+        "execution_time": 0,
+        "success": False,
+        "error": str(error)
+    }
+
+def evaluate_task_with_algorithm(G, author_skills, task, algorithm_func, algorithm_name, method='dijkstra', seed=None,
+                                 n_starts=1):
     """Evaluate the performance of a single task using the specified algorithm"""
     skill_set = set(task["skills"])
-    t = task["t"]
-    s = task["s"]
     
     try:
         start_time = time.time()
-        team, cost, connected = algorithm_func(G, author_skills, skill_set)
+        team, cost, connected = algorithm_func(G, author_skills, skill_set, method=method, seed=seed,
+                                               n_starts=n_starts)
         execution_time = time.time() - start_time
         
-        team_size = len(team) if team else 0
-
-        # When team size is 1, set communication cost to 0
-        if team_size == 1:
-            cost = 0
-        elif team_size == 0:
-            cost = float('inf')
-
-        # Calculate skill coverage
-        if team:
-            covered_skills_set = set.union(*[author_skills.get(a, set()) for a in team])
-            covered_skills = len(skill_set & covered_skills_set)
-        else:
-            covered_skills = 0
-        
-        result = {
-            "algorithm": algorithm_name,
-            "t": t,
-            "s": s,
-            "team_size": team_size,
-            "required_skills": len(skill_set),
-            "covered_skills": covered_skills,
-            "communication_cost": float('inf') if cost is None else cost,
-            "is_connected": connected,
-            "execution_time": execution_time,
-            "success": covered_skills == len(skill_set) and team_size > 0
-        }
-        
-        return result
+        return task_result(author_skills, task, algorithm_name, team, cost, connected, execution_time)
         
     except Exception as e:
         print(f" {algorithm_name} evaluation failed: {e}")
-        return {
-            "algorithm": algorithm_name,
-            "t": t,
-            "s": s,
-            "team_size": 0,
-            "required_skills": len(skill_set),
-            "covered_skills": 0,
-            "communication_cost": float('inf'),
-            "is_connected": False,
-            "execution_time": 0,
-            "success": False,
-            "error": str(e)
-        }
+        return failed_result(task, algorithm_name, e)
+
+def iter_results(results_path):
+    # Stream evaluation results back from the JSONL checkpoint file, one record at a time
+    with open(results_path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+def repair_results(results_path):
+    # A run killed mid-write leaves a half-written last line in the JSONL file. Cut the
+    # file back to the end of the last complete record so a resumed run appends on a
+    # fresh line. Only the tail of the file is read.
+    with open(results_path, 'rb+') as f:
+        end = f.seek(0, os.SEEK_END)
+        tail = b""
+        pos = end
+        cut = -1
+        while pos > 0:
+            step = min(1 << 16, pos)
+            pos -= step
+            f.seek(pos)
+            tail = f.read(step) + tail
+            cut = tail.rstrip(b"\n").rfind(b"\n")
+            if cut >= 0:
+                break
+        last = tail[cut + 1:]
+        if not last.strip():
+            return
+        try:
+            json.loads(last)
+        except ValueError:
+            print(f" Dropping a half-written last record from {results_path}")
+            f.truncate(pos + cut + 1)
+            return
+        if not last.endswith(b"\n"):
+            f.write(b"\n")
 
 def calculate_statistics(results, algorithm_name):
-    # Calculate statistics for a specific algorithm from the results
-    # Group by t value
-    stats = defaultdict(list)
+    # Calculate statistics for a specific algorithm from the results.
+    # results can be any iterable (e.g. iter_results), only running totals are kept per t value
+    stats = defaultdict(lambda: {"count": 0, "team_size": 0, "cost_sum": 0, "cost_count": 0,
+                                 "successes": 0, "execution_time": 0})
     for r in results:
-        if r["algorithm"] == algorithm_name:
-            stats[r["t"]].append(r)
+        if r["algorithm"] != algorithm_name:
+            continue
+        s = stats[r["t"]]
+        s["count"] += 1
+        s["team_size"] += r["team_size"]
+        # only consider valid communication costs
+        if r["communication_cost"] != float('inf') and r["team_size"] > 0:
+            s["cost_sum"] += r["communication_cost"]
+            s["cost_count"] += 1
+        if r["success"]:
+            s["successes"] += 1
+        s["execution_time"] += r["execution_time"]
     
     summary = {}
     for t in sorted(stats.keys()):
-        t_results = stats[t]
+        s = stats[t]
 
         # Calculate average team size
-        avg_team_size = sum(r["team_size"] for r in t_results) / len(t_results)
+        avg_team_size = s["team_size"] / s["count"]
 
         # Calculate average communication cost (only consider valid values)
-        valid_costs = [r["communication_cost"] for r in t_results
-                      if r["communication_cost"] != float('inf') and r["team_size"] > 0]
-        avg_cost = sum(valid_costs) / len(valid_costs) if valid_costs else float('inf')
+        avg_cost = s["cost_sum"] / s["cost_count"] if s["cost_count"] else float('inf')
 
         # Calculate success rate
-        success_rate = sum(1 for r in t_results if r["success"]) / len(t_results)
+        success_rate = s["successes"] / s["count"]
 
         # Calculate average execution time
-        avg_execution_time = sum(r["execution_time"] for r in t_results) / len(t_results)
+        avg_execution_time = s["execution_time"] / s["count"]
         
         summary[str(t)] = {
             "average_team_size": round(avg_team_size, 2),
             "average_communication_cost": round(float(avg_cost), 2) if avg_cost != float('inf') else "inf",
             "success_rate": round(success_rate * 100, 1),
             "average_execution_time": round(avg_execution_time, 3),
-            "valid_cost_samples": f"{len(valid_costs)}/{len(t_results)}",
-            "total_tasks": len(t_results)
+            "valid_cost_samples": f"{s['cost_count']}/{s['count']}",
+            "total_tasks": s["count"]
         }
     
     return summary
 
 def generate_cost_plots(results, output_dir):
-    # Generate cost comparison plots for different algorithms
+    # Generate cost comparison plots for different algorithms.
+    # results can be any iterable (e.g. iter_results), only running totals are kept
     print(" Generating visualization plots...")
     
-    # Get all algorithms
-    algorithms = list(set(r["algorithm"] for r in results))
-    
-    # Group data by algorithm
-    algorithm_data = defaultdict(lambda: defaultdict(list))
+    # running totals per algorithm and t value, algorithms in order of appearance
+    algorithms = []
+    totals = defaultdict(lambda: defaultdict(lambda: {"cost_sum": 0, "cost_count": 0, "size_sum": 0,
+                                                       "successes": 0, "count": 0}))
     
     for result in results:
-        if result["communication_cost"] != float('inf') and result["success"]:
-            t = result["t"]
-            cost = result["communication_cost"]
-            algorithm = result["algorithm"]
-            algorithm_data[algorithm][t].append(cost)
+        algorithm = result["algorithm"]
+        if algorithm not in totals:
+            algorithms.append(algorithm)
+        s = totals[algorithm][result["t"]]
+        s["count"] += 1
+        if result["success"]:
+            s["successes"] += 1
+            s["size_sum"] += result["team_size"]
+            if result["communication_cost"] != float('inf'):
+                s["cost_sum"] += result["communication_cost"]
+                s["cost_count"] += 1
 
     # Prepare plotting data
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
@@ -167,11 +232,11 @@ def generate_cost_plots(results, output_dir):
         t_values = []
         avg_costs = []
         
-        for t in sorted(algorithm_data[algorithm].keys()):
-            costs = algorithm_data[algorithm][t]
-            if costs:
+        for t in sorted(totals[algorithm].keys()):
+            s = totals[algorithm][t]
+            if s["cost_count"]:
                 t_values.append(t)
-                avg_costs.append(sum(costs) / len(costs))
+                avg_costs.append(s["cost_sum"] / s["cost_count"])
         
         if t_values and avg_costs:
             ax1.plot(t_values, avg_costs, 
@@ -189,21 +254,14 @@ def generate_cost_plots(results, output_dir):
 
     # figure 2: Average team size
     for i, algorithm in enumerate(algorithms):
-        algorithm_results = [r for r in results if r["algorithm"] == algorithm]
-        team_size_data = defaultdict(list)
-        
-        for result in algorithm_results:
-            if result["success"]:
-                team_size_data[result["t"]].append(result["team_size"])
-        
         t_values = []
         avg_team_sizes = []
         
-        for t in sorted(team_size_data.keys()):
-            sizes = team_size_data[t]
-            if sizes:
+        for t in sorted(totals[algorithm].keys()):
+            s = totals[algorithm][t]
+            if s["successes"]:
                 t_values.append(t)
-                avg_team_sizes.append(sum(sizes) / len(sizes))
+                avg_team_sizes.append(s["size_sum"] / s["successes"])
         
         if t_values and avg_team_sizes:
             ax2.plot(t_values, avg_team_sizes,
@@ -229,20 +287,13 @@ def generate_cost_plots(results, output_dir):
     plt.figure(figsize=(10, 6))
     
     for i, algorithm in enumerate(algorithms):
-        algorithm_results = [r for r in results if r["algorithm"] == algorithm]
-        success_data = defaultdict(list)
-        
-        for result in algorithm_results:
-            success_data[result["t"]].append(1 if result["success"] else 0)
-        
         t_values = []
         success_rates = []
         
-        for t in sorted(success_data.keys()):
-            successes = success_data[t]
-            if successes:
-                t_values.append(t)
-                success_rates.append(sum(successes) / len(successes) * 100)
+        for t in sorted(totals[algorithm].keys()):
+            s = totals[algorithm][t]
+            t_values.append(t)
+            success_rates.append(s["successes"] / s["count"] * 100)
         
         if t_values and success_rates:
             plt.plot(t_values, success_rates,
@@ -264,60 +315,189 @@ def generate_cost_plots(results, output_dir):
 
     plt.close('all')
 
-def main():
+def save_full_results(results_file, header, results):
+    # Write {**header, "detailed_results": [...]} in the layout of json.dump(indent=2),
+    # with the detailed results streamed one record at a time
+    with open(results_file, "w", encoding='utf-8') as f:
+        head = json.dumps(header, indent=2, ensure_ascii=False)
+        f.write(head[:-2] + ',\n  "detailed_results": [')
+        count = 0
+        for result in results:
+            record = json.dumps(result, indent=2, ensure_ascii=False).replace("\n", "\n    ")
+            f.write((",\n    " if count else "\n    ") + record)
+            count += 1
+        f.write("\n  ]\n}" if count else "]\n}")
+
+def _task_seed(task_index):
+    seed = _steiner_options["seed"]
+    return None if seed is None else seed + task_index
+
+def _init_worker(steiner_options):
+    # Only needed without fork: every worker loads the data once from the compact graph cache
+    global _worker_data
+    _steiner_options.update(steiner_options)
+    if _steiner_options["spt_cache_mb"] is not None and not spt_cache_enabled():
+        configure_spt_cache(max_bytes=_steiner_options["spt_cache_mb"] << 20)
+    if _worker_data is None:
+        _worker_data = load_data()
+
+def _evaluate_job(job):
+    # Evaluate one (algorithm, task) pair inside a worker process
+    algorithm_name, task_index = job
+    G, author_skills, tasks = _worker_data
+    try:
+        result = evaluate_task_with_algorithm(G, author_skills, tasks[task_index], ALGORITHMS[algorithm_name], algorithm_name,
+                                              method=_steiner_options["method"], seed=_task_seed(task_index),
+                                              n_starts=_steiner_options["n_starts"])
+        return job, result, None
+    except Exception as e:
+        return job, None, str(e)
+
+def run_evaluations(G, author_skills, tasks, jobs, workers=1, chunksize=None):
+    # Yield (job, result, error) for every (algorithm, task index) job in job order.
+    # With workers > 1 the jobs run in a process pool; the data reaches the workers
+    # through fork copy-on-write (or one cache load per worker) instead of per-task pickling.
+    global _worker_data
+    _worker_data = (G, author_skills, tasks)
+
+    if workers <= 1:
+        for job in jobs:
+            yield _evaluate_job(job)
+        return
+
+    if chunksize is None:
+        chunksize = max(1, len(jobs) // (workers * 8))
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context("spawn")
+
+    with context.Pool(processes=workers, initializer=_init_worker, initargs=(dict(_steiner_options),)) as pool:
+        # imap keeps results in submission order, so the merge is deterministic
+        yield from pool.imap(_evaluate_job, jobs, chunksize=chunksize)
+
+def run_batched_evaluations(G, author_skills, tasks, jobs, batch_size):
+    # Yield (job, result, error) like run_evaluations, but hand up to batch_size tasks of
+    # one algorithm to form_teams at once. execution_time is the batch time split evenly
+    # over its tasks.
+    global _worker_data
+    _worker_data = (G, author_skills, tasks)
+
+    batch = []
+    for job in jobs + [None]:
+        if batch and (job is None or job[0] != batch[0][0] or len(batch) == batch_size):
+            algorithm_name = batch[0][0]
+            batch_tasks = [tasks[i] for _, i in batch]
+            try:
+                start_time = time.time()
+                seeds = None if _steiner_options["seed"] is None else [_task_seed(i) for _, i in batch]
+                teams = form_teams(G, author_skills, batch_tasks, algorithm=ALGORITHMS[algorithm_name],
+                                   method=_steiner_options["method"], seed=seeds,
+                                   n_starts=_steiner_options["n_starts"])
+                execution_time = (time.time() - start_time) / len(batch)
+            except Exception as e:
+                # fall back to one call per task so a single failure does not sink the batch
+                print(f" {algorithm_name} batch failed ({e}), evaluating its tasks one by one")
+                for batch_job in batch:
+                    yield _evaluate_job(batch_job)
+            else:
+                for batch_job, task, (team, cost, connected) in zip(batch, batch_tasks, teams):
+                    yield batch_job, task_result(author_skills, task, algorithm_name, team, cost, connected,
+                                                 execution_time), None
+            batch = []
+        if job is not None:
+            batch.append(job)
+
+def main(workers=1, chunksize=None, results_path=None, resume=False, batch_size=1, spt_cache_mb=None,
+         method='dijkstra', seed=None, n_starts=1):
     print(" Starting multi-algorithm evaluation")
     print("=" * 60)
 
+    _steiner_options.update(method=method, seed=seed, n_starts=n_starts, spt_cache_mb=spt_cache_mb)
+
     # Load data
     G, author_skills, tasks = load_data()
 
+    # opt-in shared shortest path tree cache of that size (each worker process gets its own)
+    if spt_cache_mb is not None:
+        configure_spt_cache(max_bytes=spt_cache_mb << 20)
+
     # Define algorithms to test
-    algorithms = {
-        "CoverSteiner": cover_steiner,
-        "GraphAwareCoverSteiner": graph_aware_cover_steiner,
-        "ImprovedEnhanceSteiner": improved_enhance_steiner
-    }
+    algorithms = ALGORITHMS
 
     # Ensure output directory exists
     output_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 
                              "data", "visualized")
     os.makedirs(output_dir, exist_ok=True)
     
-    results = []
+    # Results are streamed to an append-only JSONL file as they finish
+    if results_path is None:
+        results_path = os.path.join(os.path.dirname(output_dir), "processed", "evaluation_results.jsonl")
+    os.makedirs(os.path.dirname(results_path), exist_ok=True)
+
+    # (algorithm, task index) pairs already recorded by an earlier run
+    completed = set()
+    if resume and os.path.exists(results_path):
+        repair_results(results_path)
+        completed = {(r["algorithm"], r["task_index"]) for r in iter_results(results_path)}
+        print(f" Resuming: {len(completed)} evaluations already recorded in {results_path}")
+
     total_evaluations = len(tasks) * len(algorithms)
-    current_evaluation = 0
+    current_evaluation = len(completed)
+    collected = 0
 
     print(f" Starting evaluation of {len(tasks)} tasks × {len(algorithms)} algorithms = {total_evaluations} evaluations")
+    if workers > 1:
+        print(f" Running with {workers} worker processes")
+    elif batch_size > 1:
+        print(f" Running in batches of up to {batch_size} tasks per algorithm")
 
     # Evaluate each algorithm and each task
-    for algorithm_name, algorithm_func in algorithms.items():
-        print(f"\n Testing {algorithm_name} algorithm...")
-        
-        for i, task in enumerate(tasks, 1):
+    jobs = [(algorithm_name, i) for algorithm_name in algorithms for i in range(len(tasks))
+            if (algorithm_name, i) not in completed]
+    current_algorithm = None
+
+    with open(results_path, "a" if resume else "w", encoding='utf-8') as results_out:
+        if workers <= 1 and batch_size > 1:
+            evaluations = run_batched_evaluations(G, author_skills, tasks, jobs, batch_size)
+        else:
+            evaluations = run_evaluations(G, author_skills, tasks, jobs, workers, chunksize)
+
+        for (algorithm_name, i), result, error in evaluations:
+            if algorithm_name != current_algorithm:
+                current_algorithm = algorithm_name
+                print(f"\n Testing {algorithm_name} algorithm...")
+
             current_evaluation += 1
-            
-            try:
-                result = evaluate_task_with_algorithm(G, author_skills, task, algorithm_func, algorithm_name)
-                results.append(result)
-                
-                # save results to file
-                if current_evaluation % 20 == 0:
-                    progress = (current_evaluation / total_evaluations) * 100
-                    print(f"  Progress: {current_evaluation}/{total_evaluations} ({progress:.1f}%)")
 
-            except Exception as e:
-                print(f" Evaluation failed (Task {i}, Algorithm {algorithm_name}): {e}")
+            if error is not None:
+                print(f" Evaluation failed (Task {i + 1}, Algorithm {algorithm_name}): {error}")
                 continue
 
-    print(f"\n Evaluation completed, collected {len(results)} results")
+            # save results to file
+            result["task_index"] = i
+            results_out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            results_out.flush()
+            collected += 1
+
+            if current_evaluation % 20 == 0:
+                progress = (current_evaluation / total_evaluations) * 100
+                print(f"  Progress: {current_evaluation}/{total_evaluations} ({progress:.1f}%)")
+
+    print(f"\n Evaluation completed, collected {collected} new results in {results_path}")
+    if workers <= 1 and spt_cache_enabled():
+        stats = get_spt_cache().stats()
+        print(f" Shortest path tree cache: {stats['hits']} hits, {stats['misses']} misses "
+              f"({stats['hit_rate']:.1%}), {stats['evictions']} evictions, "
+              f"{stats['trees']} trees in {stats['bytes'] / (1 << 20):.1f}/{stats['max_bytes'] / (1 << 20):.0f} MB")
 
-    # Calculate statistics for each algorithm
     print("\n Calculating statistics...")
     all_summaries = {}
     
     for algorithm_name in algorithms.keys():
         print(f"\n{algorithm_name} algorithm results:")
-        summary = calculate_statistics(results, algorithm_name)
+        summary = calculate_statistics(iter_results(results_path), algorithm_name)
         all_summaries[algorithm_name] = summary
         
         for t in sorted([int(k) for k in summary.keys()]):
@@ -330,28 +510,54 @@ def main():
             print(f"    Average Execution Time: {s['average_execution_time']}s")
             print(f"    Valid Samples: {s['valid_cost_samples']}")
 
-    # Generate visualizations
-    generate_cost_plots(results, output_dir)
+    # Generate visualizations (results are streamed from the JSONL file, never all held in memory)
+    generate_cost_plots(iter_results(results_path), output_dir)
 
     # Save full results
-    full_results = {
+    header = {
         "evaluation_summary": {
             "total_tasks": len(tasks),
             "algorithms_tested": list(algorithms.keys()),
-            "total_evaluations": len(results)
+            "total_evaluations": sum(1 for _ in iter_results(results_path))
         },
-        "algorithm_summaries": all_summaries,
-        "detailed_results": results
+        "algorithm_summaries": all_summaries
     }
     
     results_file = os.path.join(os.path.dirname(output_dir), "processed", "evaluation_results.json")
     os.makedirs(os.path.dirname(results_file), exist_ok=True)
     
-    with open(results_file, "w", encoding='utf-8') as f:
-        json.dump(full_results, f, indent=2, ensure_ascii=False)
+    save_full_results(results_file, header, iter_results(results_path))
 
     print(f"\n Saving detailed results: {results_file}")
     print("\n Multi-algorithm evaluation completed!")
 
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Multi-algorithm team formation evaluation")
+    parser.add_argument('--workers', type=int, default=1,
+                        help='number of worker processes (default: 1, sequential)')
+    parser.add_argument('--chunksize', type=int, default=None,
+                        help='jobs handed to a worker at a time (default: jobs / (workers * 8))')
+    parser.add_argument('--results', default=None,
+                        help='JSONL checkpoint file (default: data/processed/evaluation_results.jsonl)')
+    parser.add_argument('--resume', action='store_true',
+                        help='skip (task, algorithm) pairs already recorded in the results file')
+    parser.add_argument('--batch-size', type=int, default=1,
+                        help='tasks per form_teams batch when running sequentially (default: 1, one timed '
+                             'call per task; larger batches record the batch time split evenly)')
+    parser.add_argument('--spt-cache-mb', type=int, default=None,
+                        help='use the shared shortest path tree cache with this budget in MB, e.g. 256 '
+                             '(default: off, bounded Dijkstra searches)')
+    parser.add_argument('--method', choices=['dijkstra', 'pairwise', 'mehlhorn', 'exact'], default='dijkstra',
+                        help="Steiner engine of every algorithm ('exact' falls back to 'dijkstra' above 10 terminals)")
+    parser.add_argument('--seed', type=int, default=None,
+                        help='seed the Steiner start terminals (task i uses seed + i) for reproducible runs')
+    parser.add_argument('--n-starts', type=int, default=1,
+                        help='start terminals per Steiner tree, the cheapest tree is kept (default: 1)')
+    return parser.parse_args()
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = parse_arguments()
+    main(workers=args.workers, chunksize=args.chunksize, results_path=args.results, resume=args.resume,
+         batch_size=args.batch_size, spt_cache_mb=args.spt_cache_mb, method=args.method,
+         seed=args.seed, n_starts=args.n_starts)
\ No newline at end of file
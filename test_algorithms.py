@@ -14,21 +14,15 @@ from algorithm.enhance_steiner import enhanced_steiner
 from algorithm.graph_aware_cover_steiner import graph_aware_cover_steiner
 from algorithm.improved_enhance_steiner import improved_enhance_steiner
 from data_processing.config import DATA_PATHS
+from data_processing.graph_cache import load_graph
 
 def load_data():
-    G = nx.read_gexf(DATA_PATHS["graph_gexf"], node_type=str)
-
-    # normalize node names to UTF-8 to avoid encoding issues
-    node_mapping = {node: node.encode('utf-8').decode('utf-8') for node in G.nodes()}
-    G = nx.relabel_nodes(G, node_mapping)
+    # node attributes are kept so the saved team subgraphs still carry skills and categories
+    G = load_graph(DATA_PATHS["graph_gexf"], with_attributes=True)
 
     # load author skills with specified encoding
     with open(DATA_PATHS["author_skills"], encoding='utf-8') as f:
-        author_skills_raw = json.load(f)
-        author_skills = {
-            author.encode('utf-8').decode('utf-8'): set(skills) if isinstance(skills, list) else skills
-            for author, skills in author_skills_raw.items()
-        }
+        author_skills = {author: set(skills) for author, skills in json.load(f).items()}
     
     return G, author_skills
 